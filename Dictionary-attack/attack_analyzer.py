@@ -6,15 +6,17 @@ Comprehensive analysis of password security and attack effectiveness
 
 import time
 import hashlib
-import matplotlib.pyplot as plt
-import pandas as pd
 from dictionary_attack import DictionaryAttack, AttackStatistics
 from password_generator import PasswordGenerator
-import seaborn as sns
-import numpy as np
 from typing import Dict, List, Tuple
 
 
+def _to_frame(rows: List[Dict]):
+    """Build a pandas DataFrame, importing pandas only when a report needs it"""
+    import pandas as pd
+    return pd.DataFrame(rows)
+
+
 class AttackAnalyzer:
     """Advanced analyzer for dictionary attacks with visualization"""
     
@@ -57,7 +59,7 @@ class AttackAnalyzer:
                     'has_symbols': any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password)
                 })
         
-        return pd.DataFrame(results)
+        return _to_frame(results)
     
     def compare_hash_algorithms(self):
         """Compare attack performance across different hash algorithms"""
@@ -103,7 +105,7 @@ class AttackAnalyzer:
                 'attempts_per_second': avg_attempts / avg_time if avg_time > 0 else 0
             })
         
-        return pd.DataFrame(results)
+        return _to_frame(results)
     
     def dictionary_size_impact(self):
         """Analyze how dictionary size affects attack success and performance"""
@@ -150,7 +152,7 @@ class AttackAnalyzer:
                 'attempts_per_second': total_attempts / total_time if total_time > 0 else 0
             })
         
-        return pd.DataFrame(results)
+        return _to_frame(results)
     
     def salt_effectiveness_test(self):
         """Test effectiveness of salted vs unsalted hashes"""
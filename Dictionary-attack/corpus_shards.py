@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Sharded Password Corpus Pipeline
+Generates large password corpora across processes with deterministic shards
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from password_generator import BulkPasswordGenerator
+
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def plan_shards(total: int, shard_size: int) -> List[int]:
+    """Split a corpus size into fixed-size shards (last one may be short)"""
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    full, rest = divmod(total, shard_size)
+    return [shard_size] * full + ([rest] if rest else [])
+
+
+def shard_file_name(index: int) -> str:
+    """File name of a shard inside the corpus directory"""
+    return f"shard-{index:05d}.txt"
+
+
+def _write_shard(task: Dict) -> Dict:
+    """Generate one shard from its own seed stream and write it to disk"""
+    seed_seq = np.random.SeedSequence(task['entropy'], spawn_key=tuple(task['spawn_key']))
+    generator = BulkPasswordGenerator(mix=task['mix'], strong_length=task['strong_length'],
+                                      rng=np.random.default_rng(seed_seq))
+    
+    totals = dict.fromkeys(generator.CATEGORIES, 0)
+    digest = hashlib.sha256()
+    size = 0
+    with open(task['path'], 'wb') as f:
+        for data, counts in generator.iter_chunks(task['count'], task['chunk_size']):
+            f.write(data)
+            digest.update(data)
+            size += len(data)
+            for category, n in counts.items():
+                totals[category] += n
+    
+    return {
+        'index': task['index'],
+        'file': os.path.basename(task['path']),
+        'spawn_key': list(task['spawn_key']),
+        'count': task['count'],
+        'categories': totals,
+        'bytes': size,
+        'sha256': digest.hexdigest(),
+    }
+
+
+def _shard_tasks(manifest: Dict, output_dir: str) -> List[Dict]:
+    """Build the per-shard work items described by a manifest"""
+    root = np.random.SeedSequence(manifest['seed'])
+    counts = plan_shards(manifest['total'], manifest['shard_size'])
+    return [{
+        'index': index,
+        'path': os.path.join(output_dir, shard_file_name(index)),
+        'count': count,
+        'entropy': root.entropy,
+        'spawn_key': child.spawn_key,
+        'mix': manifest['mix'],
+        'chunk_size': manifest['chunk_size'],
+        'strong_length': manifest['strong_length'],
+    } for index, (count, child) in enumerate(zip(counts, root.spawn(len(counts))))]
+
+
+def _run_tasks(tasks: List[Dict], workers: Optional[int]) -> List[Dict]:
+    """Run shard tasks inline or on a process pool, preserving shard order"""
+    if workers == 1 or len(tasks) <= 1:
+        return [_write_shard(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_shard, tasks))
+
+
+def generate_sharded_corpus(output_dir: str, total: int, seed: Optional[int] = None,
+                            shard_size: int = 1_000_000, workers: Optional[int] = None,
+                            mix: Optional[Dict[str, float]] = None, chunk_size: int = 250_000,
+                            strong_length: int = 12) -> Dict:
+    """Generate a sharded corpus and write its manifest
+    
+    Shard boundaries depend only on `total` and `shard_size`, and shard i
+    always draws from the i-th child of SeedSequence(seed), so the corpus is
+    identical for any number of workers.
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    os.makedirs(output_dir, exist_ok=True)
+    
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'seed': seed,
+        'total': total,
+        'shard_size': shard_size,
+        'chunk_size': chunk_size,
+        'strong_length': strong_length,
+        'mix': dict(BulkPasswordGenerator.DEFAULT_MIX if mix is None else mix),
+    }
+    manifest['shards'] = _run_tasks(_shard_tasks(manifest, output_dir), workers)
+    
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(output_dir: str) -> Dict:
+    """Load the manifest of a generated corpus"""
+    with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def regenerate_corpus(manifest_dir: str, output_dir: Optional[str] = None,
+                      workers: Optional[int] = None, shards: Optional[List[int]] = None) -> List[Dict]:
+    """Rebuild some or all shards of a corpus from its manifest"""
+    manifest = load_manifest(manifest_dir)
+    output_dir = output_dir or manifest_dir
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = _shard_tasks(manifest, output_dir)
+    if shards is not None:
+        tasks = [tasks[index] for index in shards]
+    return _run_tasks(tasks, workers)
+
+
+def verify_corpus(output_dir: str) -> List[int]:
+    """Return the indices of shards whose files do not match the manifest"""
+    manifest = load_manifest(output_dir)
+    bad = []
+    for shard in manifest['shards']:
+        digest = hashlib.sha256()
+        try:
+            with open(os.path.join(output_dir, shard['file']), 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        except FileNotFoundError:
+            bad.append(shard['index'])
+            continue
+        if digest.hexdigest() != shard['sha256']:
+            bad.append(shard['index'])
+    return bad
+
+
+def main():
+    """Generate, verify or repair a sharded password corpus"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('output_dir')
+    parser.add_argument('--total', type=int, default=10_000_000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--shard-size', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--verify', action='store_true', help='check shards against the manifest')
+    parser.add_argument('--repair', action='store_true', help='regenerate shards that fail verification')
+    args = parser.parse_args()
+    
+    if args.verify or args.repair:
+        bad = verify_corpus(args.output_dir)
+        print(f"{len(bad)} shard(s) differ from the manifest: {bad}")
+        if args.repair and bad:
+            regenerate_corpus(args.output_dir, workers=args.workers, shards=bad)
+            print(f"Regenerated {len(bad)} shard(s)")
+        return
+    
+    manifest = generate_sharded_corpus(args.output_dir, args.total, seed=args.seed,
+                                       shard_size=args.shard_size, workers=args.workers)
+    print(f"Wrote {manifest['total']:,} passwords in {len(manifest['shards'])} shards "
+          f"to {args.output_dir} (seed {manifest['seed']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,47 +4,176 @@ Dictionary Attack Simulation
 A comprehensive simulation of dictionary-based password attacks
 """
 
-import hashlib
 import time
 import random
 import string
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator, Sequence, Set, Union
 import itertools
+import math
 import os
+from array import array
 from collections import Counter
 
+import hash_backends
+
 
 class PasswordHasher:
-    """Class to handle password hashing using various algorithms"""
+    """Class to handle password hashing using various algorithms
+    
+    The implementation behind each algorithm is chosen by hash_backends,
+    which benchmarks the available ones once and caches the choice.
+    """
     
     @staticmethod
     def hash_password(password: str, algorithm: str = 'sha256', salt: str = '') -> str:
         """Hash a password using specified algorithm"""
         full_password = salt + password
+        return hash_backends.get_constructor(algorithm)(full_password.encode()).hexdigest()
+    
+    @staticmethod
+    def digest_size(algorithm: str) -> int:
+        """Size in bytes of one raw digest"""
+        return hash_backends.get_constructor(algorithm)().digest_size
+    
+    @staticmethod
+    def pack_candidates(candidates: Sequence[str]) -> Tuple[bytes, List[int]]:
+        """Pack candidates into one bytes buffer plus n+1 boundary offsets"""
+        encoded = [candidate.encode() for candidate in candidates]
+        offsets = [0] * (len(encoded) + 1)
+        for i, candidate in enumerate(encoded):
+            offsets[i + 1] = offsets[i] + len(candidate)
+        return b''.join(encoded), offsets
+    
+    @staticmethod
+    def hash_many(candidates: Union[Sequence[Union[str, bytes]], bytes], algorithm: str = 'sha256',
+                  salt: str = '', offsets: Optional[Sequence[int]] = None) -> bytes:
+        """Hash a block of candidates and return their raw digests back to back
         
-        if algorithm == 'md5':
-            return hashlib.md5(full_password.encode()).hexdigest()
-        elif algorithm == 'sha1':
-            return hashlib.sha1(full_password.encode()).hexdigest()
-        elif algorithm == 'sha256':
-            return hashlib.sha256(full_password.encode()).hexdigest()
-        elif algorithm == 'sha512':
-            return hashlib.sha512(full_password.encode()).hexdigest()
+        `candidates` is either a sequence of str/bytes, or a packed buffer
+        whose i-th candidate is candidates[offsets[i]:offsets[i + 1]].
+        Digest i occupies bytes [i * digest_size, (i + 1) * digest_size).
+        A batch hasher registered with hash_backends gets the whole block.
+        """
+        if offsets is not None:
+            view = memoryview(candidates)
+            items = [view[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
         else:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
+            items = [c.encode() if isinstance(c, str) else c for c in candidates]
+        
+        batch = hash_backends.get_batch_hasher(algorithm)
+        if batch is not None:
+            return batch(items, salt.encode())
+        
+        constructor = hash_backends.get_constructor(algorithm)
+        if not salt:
+            return b''.join([constructor(item).digest() for item in items])
+        
+        # Hash the salt once and clone that state for every candidate
+        copy = constructor(salt.encode()).copy
+        digests = []
+        for item in items:
+            hasher = copy()
+            hasher.update(item)
+            digests.append(hasher.digest())
+        return b''.join(digests)
+    
+    @staticmethod
+    def use_backend(algorithm: str, backend: Optional[str]):
+        """Override the backend used for an algorithm (None re-enables probing)"""
+        hash_backends.set_backend(algorithm, backend)
+
+
+class CrackTimeHistogram:
+    """Log2-bucketed histogram of time-to-crack that can be merged across runs"""
+    
+    def __init__(self, min_seconds: float = 1e-6, n_buckets: int = 48):
+        # Bucket 0 holds times below min_seconds, bucket i covers
+        # [min_seconds * 2**(i-1), min_seconds * 2**i), the last one is open-ended
+        self.min_seconds = min_seconds
+        self.n_buckets = n_buckets
+        self.counts = array('q', bytes(8 * n_buckets))
+    
+    def bucket(self, seconds: float) -> int:
+        """Return the bucket index for a duration"""
+        if seconds < self.min_seconds:
+            return 0
+        return min(self.n_buckets - 1, int(math.log2(seconds / self.min_seconds)) + 1)
+    
+    def bucket_bounds(self, index: int) -> Tuple[float, float]:
+        """Return the [low, high) range in seconds covered by a bucket"""
+        low = 0.0 if index == 0 else self.min_seconds * 2 ** (index - 1)
+        high = math.inf if index == self.n_buckets - 1 else self.min_seconds * 2 ** index
+        return low, high
+    
+    def add(self, seconds: float, count: int = 1):
+        """Record `count` cracks that took `seconds`"""
+        self.counts[self.bucket(seconds)] += count
+    
+    def add_many(self, durations):
+        """Record several durations, skipping NaN (uncracked) entries"""
+        for seconds in durations:
+            if seconds == seconds:
+                self.counts[self.bucket(seconds)] += 1
+    
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+    
+    def merge(self, other: 'CrackTimeHistogram') -> 'CrackTimeHistogram':
+        """Add another histogram's counts into this one"""
+        if (other.min_seconds, other.n_buckets) != (self.min_seconds, self.n_buckets):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        return self
+    
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket containing the q-th percentile (0-100)"""
+        total = self.total
+        if total == 0:
+            return math.nan
+        rank = q / 100 * total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return self.bucket_bounds(i)[1]
+        return math.inf
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON/pickle friendly dict (e.g. to ship from a worker)"""
+        return {'min_seconds': self.min_seconds, 'n_buckets': self.n_buckets,
+                'counts': list(self.counts)}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CrackTimeHistogram':
+        histogram = cls(data['min_seconds'], data['n_buckets'])
+        histogram.counts = array('q', data['counts'])
+        return histogram
 
 
 class DictionaryAttack:
     """Main class for dictionary attack simulation"""
     
-    def __init__(self, hash_algorithm: str = 'sha256', salt: str = ''):
+    def __init__(self, hash_algorithm: str = 'sha256', salt: str = '', block_size: int = 4096):
         self.hash_algorithm = hash_algorithm
         self.salt = salt
         self.hasher = PasswordHasher()
+        # Candidates are hashed block_size at a time through hash_many
+        self.block_size = block_size
+        self.digest_size = PasswordHasher.digest_size(hash_algorithm)
         self.attempts = 0
+        self.total_attempts = 0
         self.start_time = None
         self.found_passwords = {}
         
+        # Per-target crack tracking for the last attack_multiple_hashes call,
+        # indexed like crack_targets (-1 / NaN for targets not cracked)
+        self.crack_targets = []
+        self.crack_attempts = array('q')
+        self.crack_elapsed = array('d')
+        self.crack_histogram = CrackTimeHistogram()
+        
     def load_dictionary(self, dictionary_path: str) -> List[str]:
         """Load dictionary from file"""
         try:
@@ -83,29 +212,70 @@ class DictionaryAttack:
             target_hashes[hash_value] = password
         return target_hashes
     
+    def _iter_blocks(self, candidates) -> Iterator[List]:
+        """Split an iterable of candidates into lists of block_size"""
+        iterator = iter(candidates)
+        while True:
+            block = list(itertools.islice(iterator, self.block_size))
+            if not block:
+                return
+            yield block
+    
+    def _find_digests(self, digests: bytes, targets: Set[bytes]) -> List[Tuple[int, bytes]]:
+        """Return (index, digest) of the first occurrence of each target in a digest buffer"""
+        size = self.digest_size
+        hits = []
+        if len(targets) <= 8:
+            # A few bytes.find scans beat splitting the buffer into digests
+            for target in targets:
+                position = digests.find(target)
+                while position != -1 and position % size:
+                    position = digests.find(target, position + 1)
+                if position != -1:
+                    hits.append((position // size, target))
+        else:
+            chunks = [digests[i:i + size] for i in range(0, len(digests), size)]
+            if targets.isdisjoint(chunks):
+                return hits
+            seen = set()
+            for index, digest in enumerate(chunks):
+                if digest in targets and digest not in seen:
+                    seen.add(digest)
+                    hits.append((index, digest))
+        hits.sort()
+        return hits
+    
     def attack_single_hash(self, target_hash: str, dictionary: List[str]) -> Optional[str]:
         """Attempt to crack a single hash using dictionary"""
         self.attempts = 0
         self.start_time = time.time()
+        target = {bytes.fromhex(target_hash)}
         
         print(f"Attacking hash: {target_hash[:16]}...")
         
-        for password in dictionary:
-            self.attempts += 1
-            computed_hash = self.hasher.hash_password(password, self.hash_algorithm, self.salt)
+        for block in self._iter_blocks(dictionary):
+            digests = self.hasher.hash_many(block, self.hash_algorithm, self.salt)
+            hits = self._find_digests(digests, target)
             
-            if computed_hash == target_hash:
+            if hits:
+                index = hits[0][0]
+                password = block[index]
+                self.attempts += index + 1
                 elapsed_time = time.time() - self.start_time
                 print(f"✓ Password found: '{password}' after {self.attempts} attempts in {elapsed_time:.2f}s")
+                self.total_attempts += self.attempts
                 return password
             
             # Progress indicator for large dictionaries
-            if self.attempts % 10000 == 0:
+            previous = self.attempts
+            self.attempts += len(block)
+            if self.attempts // 10000 > previous // 10000:
                 elapsed_time = time.time() - self.start_time
                 rate = self.attempts / elapsed_time if elapsed_time > 0 else 0
                 print(f"  Tried {self.attempts} passwords ({rate:.0f} attempts/sec)...")
         
         elapsed_time = time.time() - self.start_time
+        self.total_attempts += self.attempts
         print(f"✗ Password not found after {self.attempts} attempts in {elapsed_time:.2f}s")
         return None
     
@@ -114,32 +284,49 @@ class DictionaryAttack:
         self.attempts = 0
         self.start_time = time.time()
         found_passwords = {}
-        remaining_hashes = target_hashes.copy()
+        remaining_hashes = {bytes.fromhex(hash_value): hash_value for hash_value in target_hashes}
+        remaining = set(remaining_hashes)
+        
+        # Preallocated tracking arrays, only touched when a target is cracked
+        self.crack_targets = list(target_hashes)
+        target_index = {hash_value: i for i, hash_value in enumerate(self.crack_targets)}
+        self.crack_attempts = array('q', [-1]) * len(target_hashes)
+        self.crack_elapsed = array('d', [math.nan]) * len(target_hashes)
+        self.crack_histogram = CrackTimeHistogram()
         
         print(f"Attacking {len(target_hashes)} hashes simultaneously...")
         
-        for password in dictionary:
-            self.attempts += 1
-            computed_hash = self.hasher.hash_password(password, self.hash_algorithm, self.salt)
+        for block in self._iter_blocks(dictionary):
+            digests = self.hasher.hash_many(block, self.hash_algorithm, self.salt)
+            block_start = self.attempts
             
-            if computed_hash in remaining_hashes:
-                original_password = remaining_hashes[computed_hash]
+            for index, digest in self._find_digests(digests, remaining):
+                password = block[index]
+                computed_hash = remaining_hashes.pop(digest)
+                remaining.discard(digest)
+                original_password = target_hashes[computed_hash]
                 found_passwords[computed_hash] = password
+                self.attempts = block_start + index + 1
+                target = target_index[computed_hash]
+                self.crack_attempts[target] = self.attempts
+                self.crack_elapsed[target] = time.time() - self.start_time
+                self.crack_histogram.add(self.crack_elapsed[target])
                 print(f"✓ Found password: '{password}' (original: '{original_password}')")
-                del remaining_hashes[computed_hash]
-                
-                if not remaining_hashes:
-                    break
+            
+            if not remaining:
+                break
+            self.attempts = block_start + len(block)
             
             # Progress indicator
-            if self.attempts % 5000 == 0:
+            if self.attempts // 5000 > block_start // 5000:
                 elapsed_time = time.time() - self.start_time
                 rate = self.attempts / elapsed_time if elapsed_time > 0 else 0
                 found_count = len(found_passwords)
-                remaining_count = len(remaining_hashes)
+                remaining_count = len(remaining)
                 print(f"  Progress: {self.attempts} attempts, {found_count} found, {remaining_count} remaining ({rate:.0f} attempts/sec)")
         
         elapsed_time = time.time() - self.start_time
+        self.total_attempts += self.attempts
         success_rate = len(found_passwords) / len(target_hashes) * 100
         print(f"\nAttack completed: {len(found_passwords)}/{len(target_hashes)} passwords cracked ({success_rate:.1f}% success rate)")
         print(f"Total attempts: {self.attempts}, Time: {elapsed_time:.2f}s, Rate: {self.attempts/elapsed_time:.0f} attempts/sec")
@@ -150,28 +337,37 @@ class DictionaryAttack:
         """Perform brute force attack for short passwords"""
         self.attempts = 0
         self.start_time = time.time()
+        target = {bytes.fromhex(target_hash)}
+        symbols = [c.encode() for c in charset]
         
         print(f"Brute force attack on hash {target_hash[:16]}... (max length: {max_length})")
         
         for length in range(1, max_length + 1):
-            for password in itertools.product(charset, repeat=length):
-                password_str = ''.join(password)
-                self.attempts += 1
-                
-                computed_hash = self.hasher.hash_password(password_str, self.hash_algorithm, self.salt)
+            candidates = map(b''.join, itertools.product(symbols, repeat=length))
+            
+            for block in self._iter_blocks(candidates):
+                digests = self.hasher.hash_many(block, self.hash_algorithm, self.salt)
+                hits = self._find_digests(digests, target)
                 
-                if computed_hash == target_hash:
+                if hits:
+                    index = hits[0][0]
+                    password_str = block[index].decode()
+                    self.attempts += index + 1
                     elapsed_time = time.time() - self.start_time
                     print(f"✓ Password found: '{password_str}' after {self.attempts} attempts in {elapsed_time:.2f}s")
+                    self.total_attempts += self.attempts
                     return password_str
                 
                 # Progress indicator
-                if self.attempts % 10000 == 0:
+                previous = self.attempts
+                self.attempts += len(block)
+                if self.attempts // 10000 > previous // 10000:
                     elapsed_time = time.time() - self.start_time
                     rate = self.attempts / elapsed_time if elapsed_time > 0 else 0
                     print(f"  Tried {self.attempts} passwords (length {length}) - {rate:.0f} attempts/sec")
         
         elapsed_time = time.time() - self.start_time
+        self.total_attempts += self.attempts
         print(f"✗ Password not found after {self.attempts} attempts in {elapsed_time:.2f}s")
         return None
 
@@ -181,10 +377,14 @@ class AttackStatistics:
     
     def __init__(self):
         self.results = []
+        self.crack_histogram = CrackTimeHistogram()
     
     def add_result(self, attack_type: str, target_count: int, found_count: int, 
-                   attempts: int, time_taken: float, algorithm: str):
+                   attempts: int, time_taken: float, algorithm: str,
+                   crack_histogram: Optional[CrackTimeHistogram] = None):
         """Add attack result to statistics"""
+        if crack_histogram is not None:
+            self.crack_histogram.merge(crack_histogram)
         self.results.append({
             'attack_type': attack_type,
             'target_count': target_count,
@@ -193,9 +393,15 @@ class AttackStatistics:
             'attempts': attempts,
             'time_taken': time_taken,
             'attempts_per_second': attempts / time_taken if time_taken > 0 else 0,
-            'algorithm': algorithm
+            'algorithm': algorithm,
+            'crack_histogram': crack_histogram.to_dict() if crack_histogram is not None else None
         })
     
+    def merge(self, other: 'AttackStatistics'):
+        """Merge results collected elsewhere (another worker or run)"""
+        self.results.extend(other.results)
+        self.crack_histogram.merge(other.crack_histogram)
+    
     def print_summary(self):
         """Print attack statistics summary"""
         if not self.results:
@@ -228,6 +434,13 @@ class AttackStatistics:
         print(f"  Total Attempts: {total_attempts:,}")
         print(f"  Total Time: {total_time:.2f}s")
         print(f"  Average Speed: {total_attempts/total_time:,.0f} attempts/sec")
+        
+        if self.crack_histogram.total:
+            print(f"  Time-to-crack p50/p90/p99: "
+                  f"<{self.crack_histogram.percentile(50):.6f}s / "
+                  f"<{self.crack_histogram.percentile(90):.6f}s / "
+                  f"<{self.crack_histogram.percentile(99):.6f}s "
+                  f"({self.crack_histogram.total} cracks)")
 
 
 def create_sample_dictionaries():
@@ -327,7 +540,8 @@ def main():
                 found_count=len(found_passwords),
                 attempts=attacker.attempts,
                 time_taken=elapsed_time,
-                algorithm=algorithm
+                algorithm=algorithm,
+                crack_histogram=attacker.crack_histogram
             )
     
     # Demonstrate brute force attack on a simple password
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Hash Backend Selection
+Probes the available hash implementations and picks the fastest one per algorithm,
+keeping the default unless another backend is clearly faster
+"""
+
+import functools
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+
+SUPPORTED_ALGORITHMS = ('md5', 'sha1', 'sha256', 'sha512')
+
+# "sha256=openssl,md5=named" pins individual algorithms, a bare name pins all
+OVERRIDE_ENV = 'GIBBERISH_HASH_BACKEND'
+# Path of the probe cache; set to an empty string to disable caching
+CACHE_ENV = 'GIBBERISH_HASH_CACHE'
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'gibberish', 'hash_backends.json')
+
+# A constructor takes the initial data and returns a hashlib-style object
+Constructor = Callable[..., 'hashlib._Hash']
+# A batch hasher takes a block of candidates plus the salt and returns the raw
+# digests of salt + candidate, back to back, in one call
+BatchHasher = Callable[[Sequence[bytes], bytes], bytes]
+
+DEFAULT_BACKEND = 'named'
+# Another backend replaces the default only when it is at least this much faster,
+# so timing noise between equivalent implementations does not flip the choice
+SWITCH_MARGIN = 0.15
+
+
+def _named_backend(algorithm: str) -> Optional[Constructor]:
+    """Named hashlib constructors such as hashlib.sha256"""
+    return getattr(hashlib, algorithm, None)
+
+
+def _new_backend(algorithm: str) -> Optional[Constructor]:
+    """Generic hashlib.new lookup"""
+    try:
+        hashlib.new(algorithm)
+    except ValueError:
+        return None
+    return functools.partial(hashlib.new, algorithm)
+
+
+def _openssl_backend(algorithm: str) -> Optional[Constructor]:
+    """OpenSSL constructors exposed directly by the _hashlib extension"""
+    try:
+        import _hashlib
+    except ImportError:
+        return None
+    return getattr(_hashlib, f'openssl_{algorithm}', None)
+
+
+_BACKENDS: Dict[str, Callable[[str], Optional[Constructor]]] = {
+    'named': _named_backend,
+    'new': _new_backend,
+    'openssl': _openssl_backend,
+}
+
+_BATCH_BACKENDS: Dict[str, Callable[[str], Optional[BatchHasher]]] = {}
+
+_constructors: Dict[str, Constructor] = {}
+_batch_hashers: Dict[str, Optional[BatchHasher]] = {}
+_selected: Dict[str, str] = {}
+_overrides: Dict[str, str] = {}
+
+
+def _clear_selection():
+    _constructors.clear()
+    _batch_hashers.clear()
+    _selected.clear()
+
+
+def register_backend(name: str, factory: Optional[Callable[[str], Optional[Constructor]]] = None,
+                     batch_factory: Optional[Callable[[str], Optional[BatchHasher]]] = None):
+    """Register an extra backend, e.g. a C extension
+    
+    `factory(algorithm)` returns a hashlib-compatible constructor, or None
+    when the backend does not support that algorithm. `batch_factory(algorithm)`
+    returns a BatchHasher that hashes a whole block of candidates per call
+    (or None); PasswordHasher.hash_many dispatches to it instead of looping
+    over candidates in Python. Either factory may be omitted.
+    """
+    if factory is None and batch_factory is None:
+        raise ValueError("register_backend needs a factory or a batch_factory")
+    if factory is not None:
+        _BACKENDS[name] = factory
+    if batch_factory is not None:
+        _BATCH_BACKENDS[name] = batch_factory
+    _clear_selection()
+
+
+def available_backends(algorithm: str) -> Dict[str, Constructor]:
+    """Return the usable constructors for an algorithm, keyed by backend name
+    
+    Backends that resolve to the same constructor object (hashlib.sha256 is
+    _hashlib.openssl_sha256 on OpenSSL builds) are listed once, under the
+    first registered name.
+    """
+    backends = {}
+    for name, factory in _BACKENDS.items():
+        constructor = factory(algorithm)
+        if constructor is not None and not any(constructor is seen for seen in backends.values()):
+            backends[name] = constructor
+    return backends
+
+
+def benchmark_constructor(constructor: Constructor, rounds: int = 3, count: int = 5000) -> float:
+    """Best-of-N seconds per hash of a short password-sized input"""
+    payload = b'password123!'
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(count):
+            constructor(payload).hexdigest()
+        best = min(best, (time.perf_counter() - start) / count)
+    return best
+
+
+def probe(algorithm: str) -> Tuple[str, Dict[str, float]]:
+    """Benchmark every available backend and return (chosen name, timings)
+    
+    The default backend is kept unless the fastest one beats it by SWITCH_MARGIN.
+    """
+    timings = {name: benchmark_constructor(constructor)
+               for name, constructor in available_backends(algorithm).items()}
+    fastest = min(timings, key=timings.get)
+    if DEFAULT_BACKEND in timings and timings[fastest] > timings[DEFAULT_BACKEND] * (1 - SWITCH_MARGIN):
+        return DEFAULT_BACKEND, timings
+    return fastest, timings
+
+
+def _fingerprint() -> str:
+    """Identify the interpreter/OpenSSL build a cached probe result belongs to"""
+    try:
+        import ssl
+        openssl = ssl.OPENSSL_VERSION
+    except ImportError:
+        openssl = 'none'
+    return '|'.join([sys.version, platform.machine(), openssl, ','.join(sorted(_BACKENDS)),
+                     str(SWITCH_MARGIN)])
+
+
+def _cache_path() -> Optional[str]:
+    path = os.environ.get(CACHE_ENV, DEFAULT_CACHE_PATH)
+    return path or None
+
+
+def _load_cache() -> Dict[str, str]:
+    path = _cache_path()
+    if path is None:
+        return {}
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('fingerprint') != _fingerprint():
+        return {}
+    return cache.get('selected', {})
+
+
+def _save_cache(selected: Dict[str, str]):
+    path = _cache_path()
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'fingerprint': _fingerprint(), 'selected': selected}, f, indent=2)
+    except OSError:
+        pass  # caching is best effort, e.g. on a read-only home directory
+
+
+def _env_overrides() -> Dict[str, str]:
+    value = os.environ.get(OVERRIDE_ENV, '').strip()
+    if not value:
+        return {}
+    if '=' not in value:
+        return dict.fromkeys(SUPPORTED_ALGORITHMS, value)
+    return dict(item.split('=', 1) for item in value.split(',') if item)
+
+
+def set_backend(algorithm: str, name: Optional[str]):
+    """Pin an algorithm to a backend by name (None restores auto-selection)"""
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    if name is None:
+        _overrides.pop(algorithm, None)
+    else:
+        _overrides[algorithm] = name
+    _constructors.pop(algorithm, None)
+    _batch_hashers.pop(algorithm, None)
+    _selected.pop(algorithm, None)
+
+
+def _pinned(algorithm: str) -> Optional[str]:
+    return _overrides.get(algorithm) or _env_overrides().get(algorithm)
+
+
+def _resolve(algorithm: str) -> Constructor:
+    """Pick a backend: explicit override, then cached probe, then a fresh probe"""
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    
+    backends = available_backends(algorithm)
+    pinned = _pinned(algorithm)
+    if pinned is not None and pinned not in backends and pinned not in _BATCH_BACKENDS:
+        raise ValueError(f"Hash backend '{pinned}' is not available for {algorithm}")
+    if pinned in backends:
+        name = pinned
+    else:
+        # Not pinned, or pinned to a batch-only backend: single hashes still need a constructor
+        cached = _load_cache()
+        name = cached.get(algorithm)
+        if name not in backends:
+            name, _ = probe(algorithm)
+            cached[algorithm] = name
+            _save_cache(cached)
+    
+    _selected[algorithm] = name
+    _constructors[algorithm] = backends[name]
+    return backends[name]
+
+
+def get_constructor(algorithm: str) -> Constructor:
+    """Return the selected constructor for an algorithm"""
+    try:
+        return _constructors[algorithm]
+    except KeyError:
+        return _resolve(algorithm)
+
+
+def get_batch_hasher(algorithm: str) -> Optional[BatchHasher]:
+    """Return the batch hasher for an algorithm, or None to hash one candidate at a time
+    
+    A pinned backend is honoured: its batch hook is used if it registered one,
+    otherwise none is. Unpinned, the first registered batch backend that
+    supports the algorithm wins.
+    """
+    if algorithm in _batch_hashers:
+        return _batch_hashers[algorithm]
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    pinned = _pinned(algorithm)
+    names = [pinned] if pinned is not None else list(_BATCH_BACKENDS)
+    hasher = None
+    for name in names:
+        factory = _BATCH_BACKENDS.get(name)
+        hasher = factory(algorithm) if factory is not None else None
+        if hasher is not None:
+            break
+    _batch_hashers[algorithm] = hasher
+    return hasher
+
+
+def selected_backends() -> Dict[str, str]:
+    """Backend names chosen so far in this process"""
+    return dict(_selected)
+
+
+def main():
+    """Probe all supported algorithms and refresh the cache"""
+    selected = {}
+    for algorithm in SUPPORTED_ALGORITHMS:
+        name, timings = probe(algorithm)
+        selected[algorithm] = name
+        details = ', '.join(f"{backend}: {seconds * 1e9:.0f}ns" for backend, seconds in sorted(timings.items()))
+        print(f"{algorithm:>7}: {name:<8} ({details})")
+    _save_cache(selected)
+
+
+if __name__ == "__main__":
+    main()
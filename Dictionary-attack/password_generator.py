@@ -6,13 +6,17 @@ Generates various types of passwords for testing attack effectiveness
 
 import random
 import string
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 
 class PasswordGenerator:
     """Generate different types of passwords for testing"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Private random stream so seeded runs don't depend on global state
+        self.random = random.Random(seed)
         self.common_words = [
             'password', 'admin', 'user', 'guest', 'root', 'test', 'demo',
             'welcome', 'login', 'secret', 'private', 'public', 'temp',
@@ -27,13 +31,24 @@ class PasswordGenerator:
         self.years = list(range(1980, 2026))
         self.months = ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']
         
+        self.weak_patterns = ['qwerty', 'asdfgh', 'zxcvbn', '111111', '000000', 'aaaaaa']
+        self.symbols = '!@#$%&*'
+        self.strong_chars = (string.ascii_lowercase + string.ascii_uppercase + 
+                             string.digits + '!@#$%^&*()_+-=[]{}|;:,.<>?')
+        self.passphrase_words = [
+            'correct', 'horse', 'battery', 'staple', 'mountain', 'river', 'ocean',
+            'forest', 'garden', 'window', 'keyboard', 'monitor', 'coffee', 'table',
+            'chair', 'book', 'paper', 'pencil', 'mouse', 'phone', 'camera', 'music'
+        ]
+        self.separators = ['-', '_', '.', ' ']
+        
     def generate_weak_passwords(self, count: int = 10) -> List[str]:
         """Generate weak, easily crackable passwords"""
         weak_passwords = []
         
         # Dictionary words with simple modifications
         for _ in range(count // 3):
-            word = random.choice(self.common_words)
+            word = self.random.choice(self.common_words)
             variations = [
                 word,
                 word.capitalize(),
@@ -41,20 +56,19 @@ class PasswordGenerator:
                 word + '1',
                 word + '!',
                 '123' + word,
-                word + str(random.randint(1, 99))
+                word + str(self.random.randint(1, 99))
             ]
-            weak_passwords.append(random.choice(variations))
+            weak_passwords.append(self.random.choice(variations))
         
         # Simple numeric passwords
         for _ in range(count // 3):
-            length = random.randint(4, 8)
-            numeric_password = ''.join([str(random.randint(0, 9)) for _ in range(length)])
+            length = self.random.randint(4, 8)
+            numeric_password = ''.join([str(self.random.randint(0, 9)) for _ in range(length)])
             weak_passwords.append(numeric_password)
         
         # Common patterns
-        patterns = ['qwerty', 'asdfgh', 'zxcvbn', '111111', '000000', 'aaaaaa']
         for _ in range(count - len(weak_passwords)):
-            weak_passwords.append(random.choice(patterns))
+            weak_passwords.append(self.random.choice(self.weak_patterns))
         
         return weak_passwords[:count]
     
@@ -64,19 +78,19 @@ class PasswordGenerator:
         
         for _ in range(count):
             # Combine word + number + symbol
-            word = random.choice(self.common_words + self.names)
-            number = str(random.randint(10, 9999))
-            symbol = random.choice('!@#$%&*')
+            word = self.random.choice(self.common_words + self.names)
+            number = str(self.random.randint(10, 9999))
+            symbol = self.random.choice(self.symbols)
             
             patterns = [
                 word.capitalize() + number + symbol,
                 word.upper() + number,
                 word + number + word[:2],
                 symbol + word + number,
-                word + str(random.choice(self.years))
+                word + str(self.random.choice(self.years))
             ]
             
-            medium_passwords.append(random.choice(patterns))
+            medium_passwords.append(self.random.choice(patterns))
         
         return medium_passwords
     
@@ -86,40 +100,30 @@ class PasswordGenerator:
         
         for _ in range(count):
             # Mix of all character types
-            chars = (string.ascii_lowercase + string.ascii_uppercase + 
-                    string.digits + '!@#$%^&*()_+-=[]{}|;:,.<>?')
-            
-            password = ''.join(random.choice(chars) for _ in range(length))
+            password = ''.join(self.random.choice(self.strong_chars) for _ in range(length))
             strong_passwords.append(password)
         
         return strong_passwords
     
     def generate_passphrase_style(self, count: int = 10) -> List[str]:
         """Generate passphrase-style passwords"""
-        words_list = [
-            'correct', 'horse', 'battery', 'staple', 'mountain', 'river', 'ocean',
-            'forest', 'garden', 'window', 'keyboard', 'monitor', 'coffee', 'table',
-            'chair', 'book', 'paper', 'pencil', 'mouse', 'phone', 'camera', 'music'
-        ]
-        
         passphrases = []
         for _ in range(count):
             # 3-4 words with separators
-            word_count = random.randint(3, 4)
-            words = random.sample(words_list, word_count)
+            word_count = self.random.randint(3, 4)
+            words = self.random.sample(self.passphrase_words, word_count)
             
             # Random capitalization
-            words = [word.capitalize() if random.random() > 0.5 else word for word in words]
+            words = [word.capitalize() if self.random.random() > 0.5 else word for word in words]
             
             # Random separators
-            separators = ['-', '_', '.', ' ']
-            separator = random.choice(separators)
+            separator = self.random.choice(self.separators)
             
             passphrase = separator.join(words)
             
             # Sometimes add numbers
-            if random.random() > 0.5:
-                passphrase += str(random.randint(1, 999))
+            if self.random.random() > 0.5:
+                passphrase += str(self.random.randint(1, 999))
             
             passphrases.append(passphrase)
         
@@ -135,6 +139,241 @@ class PasswordGenerator:
         }
 
 
+def _byte_table(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack strings into a zero-padded (n x width) uint8 matrix plus lengths"""
+    encoded = [s.encode() for s in strings]
+    width = max(1, max(len(s) for s in encoded))
+    matrix = np.frombuffer(b''.join(s.ljust(width, b'\0') for s in encoded), dtype=np.uint8)
+    lengths = np.array([len(s) for s in encoded], dtype=np.int64)
+    return matrix.reshape(len(encoded), width), lengths
+
+
+def _assemble(fields: List[Tuple[np.ndarray, np.ndarray]], count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate variable-length byte fields row by row into one matrix"""
+    width = max(1, sum(values.shape[1] for values, _ in fields))
+    out = np.zeros((count, width), dtype=np.uint8)
+    offset = np.zeros(count, dtype=np.int64)
+    for values, lengths in fields:
+        rows, cols = np.nonzero(np.arange(values.shape[1]) < lengths[:, None])
+        out[rows, offset[rows] + cols] = values[rows, cols]
+        offset += lengths
+    return out, offset
+
+
+def _pad_columns(matrix: np.ndarray, width: int) -> np.ndarray:
+    """Right-pad a byte matrix with zeros to the given width"""
+    if matrix.shape[1] == width:
+        return matrix
+    return np.pad(matrix, ((0, 0), (0, width - matrix.shape[1])))
+
+
+class BulkPasswordGenerator(PasswordGenerator):
+    """Seeded, vectorized password generation for large synthetic corpora
+    
+    Passwords are built as rows of a byte matrix, one NumPy operation per
+    field, and emitted as newline-separated chunks. The output depends only
+    on the seed, the category mix and the chunk size.
+    """
+    
+    CATEGORIES = ('weak', 'medium', 'strong', 'passphrase')
+    DEFAULT_MIX = {'weak': 15, 'medium': 10, 'strong': 8, 'passphrase': 5}
+    
+    def __init__(self, seed: Optional[int] = None, mix: Optional[Dict[str, float]] = None,
+                 strong_length: int = 12, rng: Optional[np.random.Generator] = None):
+        super().__init__(seed)
+        self.seed = seed
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.mix = self._normalize_mix(self.DEFAULT_MIX if mix is None else mix)
+        self.strong_length = strong_length
+        
+        words = self.common_words
+        medium_words = self.common_words + self.names
+        self._words = _byte_table(words)
+        self._words_cap = _byte_table([w.capitalize() for w in words])
+        self._medium_words = _byte_table(medium_words + [w.capitalize() for w in medium_words] +
+                                         [w.upper() for w in medium_words])
+        self._medium_count = len(medium_words)
+        self._weak_suffixes = _byte_table(['', '123', '1', '!'] + [str(i) for i in range(1, 100)])
+        self._weak_patterns = _byte_table(self.weak_patterns)
+        self._medium_numbers = _byte_table([str(i) for i in range(10, 10000)] +
+                                           [str(year) for year in self.years])
+        self._medium_prefixes = _byte_table([''] + list(self.symbols))
+        self._medium_suffixes = _byte_table([''] + list(self.symbols) + [w[:2] for w in medium_words])
+        self._strong_chars = np.frombuffer(self.strong_chars.encode(), dtype=np.uint8)
+        self._phrase_words = _byte_table(self.passphrase_words +
+                                         [w.capitalize() for w in self.passphrase_words])
+        self._separators = _byte_table(self.separators)
+        self._phrase_numbers = _byte_table([str(i) for i in range(1, 1000)])
+    
+    def _normalize_mix(self, mix: Dict[str, float]) -> Dict[str, float]:
+        """Validate a category mix and scale it to fractions summing to 1"""
+        unknown = set(mix) - set(self.CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown password categories: {sorted(unknown)}")
+        if any(weight < 0 for weight in mix.values()):
+            raise ValueError("Category weights must be non-negative")
+        total = sum(mix.values())
+        if total <= 0:
+            raise ValueError("Category mix must have a positive total weight")
+        return {category: mix.get(category, 0) / total for category in self.CATEGORIES}
+    
+    def split_counts(self, count: int) -> Dict[str, int]:
+        """Split a password count across categories (largest remainder rounding)"""
+        exact = {category: count * share for category, share in self.mix.items()}
+        counts = {category: int(value) for category, value in exact.items()}
+        leftover = count - sum(counts.values())
+        by_remainder = sorted(self.CATEGORIES, key=lambda c: counts[c] - exact[c])
+        for category in by_remainder[:leftover]:
+            counts[category] += 1
+        return counts
+    
+    def _weak_batch(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Dictionary-word variants, numeric strings and keyboard patterns"""
+        rng = self.rng
+        n_words = count // 3
+        n_numeric = count // 3
+        n_patterns = count - n_words - n_numeric
+        
+        # Word variants: word, Word, word123, word1, word!, 123word, word<1-99>
+        word = rng.integers(len(self.common_words), size=n_words)
+        variant = rng.integers(7, size=n_words)
+        number = rng.integers(99, size=n_words)
+        lower, lower_len = self._words
+        cap, cap_len = self._words_cap
+        word_values = np.where((variant == 1)[:, None], cap[word], lower[word])
+        word_lengths = np.where(variant == 1, cap_len[word], lower_len[word])
+        suffix = np.array([0, 0, 1, 2, 3, 0, 4])[variant] + np.where(variant == 6, number, 0)
+        prefix_values = np.broadcast_to(np.frombuffer(b'123', dtype=np.uint8), (n_words, 3))
+        prefix_lengths = np.where(variant == 5, 3, 0)
+        suffix_values, suffix_lengths = self._weak_suffixes
+        words, words_len = _assemble([
+            (prefix_values, prefix_lengths),
+            (word_values, word_lengths),
+            (suffix_values[suffix], suffix_lengths[suffix]),
+        ], n_words)
+        
+        # Simple numeric passwords of 4-8 digits
+        numeric = (rng.integers(10, size=(n_numeric, 8)) + ord('0')).astype(np.uint8)
+        numeric_len = rng.integers(4, 9, size=n_numeric)
+        numeric[np.arange(8) >= numeric_len[:, None]] = 0
+        
+        pattern = rng.integers(len(self.weak_patterns), size=n_patterns)
+        patterns, patterns_len = self._weak_patterns
+        
+        width = max(words.shape[1], numeric.shape[1], patterns.shape[1])
+        values = np.concatenate([_pad_columns(words, width), _pad_columns(numeric, width),
+                                 _pad_columns(patterns[pattern], width)])
+        return values, np.concatenate([words_len, numeric_len, patterns_len[pattern]])
+    
+    def _medium_batch(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Word + number + symbol combinations"""
+        rng = self.rng
+        n_words = self._medium_count
+        word = rng.integers(n_words, size=count)
+        number = rng.integers(9990, size=count)
+        symbol = rng.integers(len(self.symbols), size=count)
+        year = rng.integers(len(self.years), size=count)
+        pattern = rng.integers(5, size=count)
+        
+        # Patterns: Word<n><sym>, WORD<n>, word<n>wo, <sym>word<n>, word<year>
+        form = np.array([1, 2, 0, 0, 0])[pattern]
+        prefix = np.where(pattern == 3, 1 + symbol, 0)
+        middle = np.where(pattern == 4, 9990 + year, number)
+        suffix = np.where(pattern == 0, 1 + symbol,
+                          np.where(pattern == 2, 1 + len(self.symbols) + word, 0))
+        
+        prefixes, prefixes_len = self._medium_prefixes
+        words, words_len = self._medium_words
+        numbers, numbers_len = self._medium_numbers
+        suffixes, suffixes_len = self._medium_suffixes
+        word_index = word + n_words * form
+        return _assemble([
+            (prefixes[prefix], prefixes_len[prefix]),
+            (words[word_index], words_len[word_index]),
+            (numbers[middle], numbers_len[middle]),
+            (suffixes[suffix], suffixes_len[suffix]),
+        ], count)
+    
+    def _strong_batch(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Uniformly random strings over the full character set"""
+        index = self.rng.integers(len(self._strong_chars), size=(count, self.strong_length))
+        return self._strong_chars[index], np.full(count, self.strong_length, dtype=np.int64)
+    
+    def _passphrase_batch(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """3-4 distinct words with a separator and an optional number"""
+        rng = self.rng
+        n_words = len(self.passphrase_words)
+        word_count = rng.integers(3, 5, size=count)
+        chosen = rng.random((count, n_words)).argsort(axis=1)[:, :4]
+        capitalized = rng.random((count, 4)) > 0.5
+        separator = rng.integers(len(self.separators), size=count)
+        has_number = rng.random(count) > 0.5
+        number = rng.integers(999, size=count)
+        
+        words, words_len = self._phrase_words
+        separators, separators_len = self._separators
+        numbers, numbers_len = self._phrase_numbers
+        word_index = chosen + n_words * capitalized
+        has_fourth = word_count == 4
+        
+        fields = []
+        for position in range(4):
+            present = has_fourth if position == 3 else np.ones(count, dtype=bool)
+            if position > 0:
+                fields.append((separators[separator], np.where(present, separators_len[separator], 0)))
+            index = word_index[:, position]
+            fields.append((words[index], np.where(present, words_len[index], 0)))
+        fields.append((numbers[number], np.where(has_number, numbers_len[number], 0)))
+        return _assemble(fields, count)
+    
+    def generate_chunk(self, count: int) -> Tuple[bytes, Dict[str, int]]:
+        """Generate `count` newline-terminated passwords as one bytes block"""
+        counts = self.split_counts(count)
+        builders = {
+            'weak': self._weak_batch,
+            'medium': self._medium_batch,
+            'strong': self._strong_batch,
+            'passphrase': self._passphrase_batch,
+        }
+        batches = [builders[category](counts[category]) for category in self.CATEGORIES]
+        
+        width = max(values.shape[1] for values, _ in batches) + 1
+        values = np.concatenate([_pad_columns(v, width) for v, _ in batches])
+        lengths = np.concatenate([n for _, n in batches])
+        
+        # Interleave categories, then terminate every row and drop the padding
+        order = self.rng.permutation(count)
+        values, lengths = values[order], lengths[order]
+        values[np.arange(count), lengths] = ord('\n')
+        data = values[np.arange(width) <= lengths[:, None]].tobytes()
+        return data, counts
+    
+    def iter_chunks(self, total: int, chunk_size: int = 1_000_000) -> Iterator[Tuple[bytes, Dict[str, int]]]:
+        """Yield (bytes, category counts) chunks until `total` passwords are produced"""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        remaining = total
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            yield self.generate_chunk(count)
+            remaining -= count
+    
+    def generate(self, count: int) -> List[str]:
+        """Generate `count` passwords as a list of strings"""
+        data, _ = self.generate_chunk(count)
+        return data.decode().split('\n')[:-1]
+    
+    def write_corpus(self, output_file: str, total: int, chunk_size: int = 1_000_000) -> Dict[str, int]:
+        """Stream `total` passwords to a file and return per-category counts"""
+        totals = dict.fromkeys(self.CATEGORIES, 0)
+        with open(output_file, 'wb') as f:
+            for data, counts in self.iter_chunks(total, chunk_size):
+                f.write(data)
+                for category, n in counts.items():
+                    totals[category] += n
+        return totals
+
+
 def main():
     """Demo the password generator"""
     generator = PasswordGenerator()
@@ -9,32 +9,47 @@
 # >seq3
 # TTAGCTAGCTAGCTAGCTAA
 
+import os
 import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from collections import defaultdict
-from typing import List, Tuple
-from scipy.special import logsumexp
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+from motif_scoring import (background_frequencies, consensus_from_counts, hamming_from_counts,
+                           hamming_score, information_from_counts, llr_from_counts, motif_summary)
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import time
+from sequence_io import (UNKNOWN_CODE, PackedSequences, decode_sequence, encode_sequence,
+                         load_sequences, open_sequence_store)
+
+# Sampler inputs: plain strings, encoded uint8 arrays, or a PackedSequences store
+SequenceInput = Union[Sequence[str], Sequence[np.ndarray], PackedSequences]
 
 def read_fasta(file_path: str) -> List[str]:
     sequences = []
     with open(file_path, 'r') as file:
-        seq = ''
+        parts = []
         for line in file:
             line = line.strip()
             if line.startswith('>'):
-                if seq:
-                    sequences.append(seq)
-                    seq = ''
-            else:
-                seq += line
-        if seq:
-            sequences.append(seq)
+                if parts:
+                    sequences.append(''.join(parts))
+                    parts = []
+            elif line:
+                parts.append(line)
+        if parts:
+            sequences.append(''.join(parts))
     return sequences
 
+def encode_all(sequences: SequenceInput) -> List[np.ndarray]:
+    # Encoded arrays (including PackedSequences views) are used as-is, without copying
+    return [seq if isinstance(seq, np.ndarray) else encode_sequence(seq) for seq in sequences]
+
+def extract_motifs(sequences: SequenceInput, positions: Sequence[int], k: int) -> List[str]:
+    return [seq[start:start + k] if isinstance(seq, str) else decode_sequence(seq[start:start + k])
+            for seq, start in zip(sequences, positions)]
+
 def initialize_motifs(sequences: List[str], k: int) -> List[str]:
     motifs = []
     for seq in sequences:
@@ -42,72 +57,440 @@ def initialize_motifs(sequences: List[str], k: int) -> List[str]:
         motifs.append(seq[start:start + k])
     return motifs
 
+def initialize_positions(sequences: List[np.ndarray], k: int) -> np.ndarray:
+    return np.array([random.randint(0, len(seq) - k) for seq in sequences], dtype=np.int64)
+
+def count_matrix(encoded: List[np.ndarray], positions: np.ndarray, k: int) -> np.ndarray:
+    # Rows A, C, G, T, unknown; columns are motif positions
+    counts = np.zeros((5, k), dtype=np.int64)
+    columns = np.arange(k)
+    for seq, start in zip(encoded, positions):
+        counts[seq[start:start + k], columns] += 1
+    return counts
+
+def profile_from_counts(counts: np.ndarray, pseudocount: float = 1.0) -> np.ndarray:
+    profile = counts[:4] + pseudocount
+    return profile / profile.sum(axis=0)
+
 def build_profile(motifs: List[str], pseudocount: float = 1.0) -> np.ndarray:
+    # Lowercase bases count as their base; N and other symbols land in the unknown
+    # row of the count matrix and are excluded from the A/C/G/T frequencies
     k = len(motifs[0])
-    profile = np.zeros((4, k)) + pseudocount  # A, C, G, T
-    for motif in motifs:
-        for i, nucleotide in enumerate(motif):
-            if nucleotide == 'A':
-                profile[0][i] += 1
-            elif nucleotide == 'C':
-                profile[1][i] += 1
-            elif nucleotide == 'G':
-                profile[2][i] += 1
-            elif nucleotide == 'T':
-                profile[3][i] += 1
-    profile /= profile.sum(axis=0)
-    return profile
+    counts = count_matrix(encode_all(motifs), np.zeros(len(motifs), dtype=np.int64), k)
+    return profile_from_counts(counts, pseudocount)
 
 def score_motifs(motifs: List[str]) -> int:
-    score = 0
-    k = len(motifs[0])
-    for i in range(k):
-        counts = defaultdict(int)
-        for motif in motifs:
-            counts[motif[i]] += 1
-        max_count = max(counts.values())
-        score += (len(motifs) - max_count)
-    return score
+    return int(hamming_score(np.stack(encode_all(motifs))))
+
+def log_profile(profile: np.ndarray) -> np.ndarray:
+    # Extra -inf row: windows containing N or other unknown symbols are never sampled
+    return np.vstack([np.log(profile), np.full((1, profile.shape[1]), -np.inf)])
+
+def window_log_probs(encoded: np.ndarray, log_prof: np.ndarray, k: int) -> np.ndarray:
+    windows = sliding_window_view(encoded, k)
+    return log_prof[windows, np.arange(k)].sum(axis=1)
+
+def score_from_counts(counts: np.ndarray) -> int:
+    # Same as score_motifs, but O(k) from the count matrix
+    return int(hamming_from_counts(counts))
+
+def sample_motif_index(encoded: np.ndarray, log_prof: np.ndarray, k: int, rng=np.random) -> int:
+    log_probs = window_log_probs(encoded, log_prof, k)
+    if not np.isfinite(log_probs).any():
+        # Every window overlaps an unknown symbol: fall back to a uniform draw
+        return rng.choice(len(log_probs))
+    probabilities = np.exp(log_probs - np.logaddexp.reduce(log_probs))
+    return rng.choice(len(probabilities), p=probabilities)
 
 def sample_motif(sequence: str, profile: np.ndarray, k: int) -> str:
-    n = len(sequence)
-    probabilities = []
-    for i in range(n - k + 1):
-        kmer = sequence[i:i + k]
-        prob = 1.0
-        for j, nucleotide in enumerate(kmer):
-            if nucleotide == 'A':
-                prob *= profile[0][j]
-            elif nucleotide == 'C':
-                prob *= profile[1][j]
-            elif nucleotide == 'G':
-                prob *= profile[2][j]
-            elif nucleotide == 'T':
-                prob *= profile[3][j]
-        probabilities.append(prob)
-    probabilities = np.array(probabilities)
-    probabilities /= probabilities.sum()
-    chosen_index = np.random.choice(range(n - k + 1), p=probabilities)
-    return sequence[chosen_index:chosen_index + k]
-
-def gibbs_sampler(sequences: List[str], k: int, n_iterations: int, n_restarts: int) -> Tuple[List[str], int]:
+    index = sample_motif_index(encode_sequence(sequence), log_profile(profile), k)
+    return sequence[index:index + k]
+
+def gibbs_sampler(sequences: SequenceInput, k: int, n_iterations: int, n_restarts: int) -> Tuple[List[str], int]:
     best_motifs = None
     best_score = float('inf')
+    encoded = encode_all(sequences)
+    columns = np.arange(k)
     for _ in range(n_restarts):
-        motifs = initialize_motifs(sequences, k)
+        # Motifs are tracked as start positions plus a running count matrix
+        positions = initialize_positions(encoded, k)
+        counts = count_matrix(encoded, positions, k)
         for _ in range(n_iterations):
             i = random.randint(0, len(sequences) - 1)
-            current_motifs = motifs[:i] + motifs[i+1:]
-            profile = build_profile(current_motifs)
-            new_motif = sample_motif(sequences[i], profile, k)
-            motifs[i] = new_motif
+            seq = encoded[i]
+            counts[seq[positions[i]:positions[i] + k], columns] -= 1
+            profile = profile_from_counts(counts)
+            positions[i] = sample_motif_index(seq, log_profile(profile), k)
+            counts[seq[positions[i]:positions[i] + k], columns] += 1
+        motifs = extract_motifs(sequences, positions, k)
         current_score = score_motifs(motifs)
         if current_score < best_score:
             best_score = current_score
             best_motifs = motifs
     return best_motifs, best_score
 
+class GibbsChain:
+    # Resumable single chain; the Hamming score is updated in O(k) after every step
+    def __init__(self, encoded: List[np.ndarray], k: int, rng: np.random.Generator):
+        self.encoded = encoded
+        self.k = k
+        self.rng = rng
+        self.columns = np.arange(k)
+        self.positions = np.array([rng.integers(0, len(seq) - k + 1) for seq in encoded], dtype=np.int64)
+        self.counts = count_matrix(encoded, self.positions, k)
+        self.iterations = 0
+        self.score = score_from_counts(self.counts)
+        self.best_score = self.score
+        self.best_positions = self.positions.copy()
+        self.best_iteration = 0
+        self.trace: List[int] = []
+
+    @property
+    def stalled(self) -> int:
+        return self.iterations - self.best_iteration
+
+    def run(self, n_iterations: int, patience: Optional[int] = None, trace_every: int = 0) -> bool:
+        # Returns True once the best score has not improved for `patience` iterations
+        encoded, k, rng, columns, counts, positions = (self.encoded, self.k, self.rng, self.columns,
+                                                      self.counts, self.positions)
+        for _ in range(n_iterations):
+            i = rng.integers(len(encoded))
+            seq = encoded[i]
+            counts[seq[positions[i]:positions[i] + k], columns] -= 1
+            profile = profile_from_counts(counts)
+            positions[i] = sample_motif_index(seq, log_profile(profile), k, rng)
+            counts[seq[positions[i]:positions[i] + k], columns] += 1
+
+            self.iterations += 1
+            self.score = score_from_counts(counts)
+            if self.score < self.best_score:
+                self.best_score = self.score
+                self.best_positions = positions.copy()
+                self.best_iteration = self.iterations
+            if trace_every and self.iterations % trace_every == 0:
+                self.trace.append(self.score)
+            if patience is not None and self.stalled >= patience:
+                return True
+        return False
+
+def run_restart(encoded: List[np.ndarray], k: int, n_iterations: int, rng: np.random.Generator,
+                trace_every: int = 0, patience: Optional[int] = None) -> Tuple[np.ndarray, int, List[int]]:
+    # One Gibbs restart driven only by `rng`, so it is reproducible in any process.
+    # Returns the best motif positions seen, their score and the score trace.
+    chain = GibbsChain(encoded, k, rng)
+    chain.run(n_iterations, patience, trace_every)
+    return chain.best_positions, chain.best_score, chain.trace
+
+# Encoded sequences visible to pool workers (inherited on fork, set by the initializer otherwise)
+_WORKER_SEQUENCES: Optional[List[np.ndarray]] = None
+
+def _split_flat(flat: np.ndarray, offsets: np.ndarray) -> List[np.ndarray]:
+    return [flat[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+def _init_restart_worker(flat: np.ndarray, offsets: np.ndarray):
+    global _WORKER_SEQUENCES
+    _WORKER_SEQUENCES = _split_flat(flat, offsets)
+
+def _init_store_worker(store_path: str):
+    # Map the on-disk sequence store instead of receiving a pickled copy
+    global _WORKER_SEQUENCES
+    _WORKER_SEQUENCES = list(open_sequence_store(store_path))
+
+def _restart_task(task: Tuple[int, int, np.random.SeedSequence, int, Optional[int]]) -> Tuple[np.ndarray, int, List[int]]:
+    k, n_iterations, seed_seq, trace_every, patience = task
+    return run_restart(_WORKER_SEQUENCES, k, n_iterations, np.random.default_rng(seed_seq), trace_every, patience)
+
+def gibbs_sampler_parallel(sequences: SequenceInput, k: int, n_iterations: int, n_restarts: int,
+                           seed: Optional[int] = None, workers: Optional[int] = None,
+                           trace_every: int = 10,
+                           patience: Optional[int] = None) -> Tuple[List[str], int, List[Dict]]:
+    # Restart r always uses the r-th child of SeedSequence(seed), so results do not
+    # depend on the number of workers; ties go to the lowest restart index.
+    global _WORKER_SEQUENCES
+    encoded = encode_all(sequences)
+    seeds = np.random.SeedSequence(seed).spawn(n_restarts)
+    tasks = [(k, n_iterations, seed_seq, trace_every, patience) for seed_seq in seeds]
+
+    if workers == 1 or n_restarts <= 1:
+        results = [run_restart(encoded, k, n_iterations, np.random.default_rng(s), trace_every, patience)
+                   for s in seeds]
+    else:
+        if isinstance(sequences, PackedSequences):
+            flat, offsets = sequences.codes, sequences.offsets
+        else:
+            flat = np.concatenate(encoded)
+            offsets = np.concatenate([[0], np.cumsum([len(seq) for seq in encoded])])
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Workers share the parent's arrays copy-on-write
+            _WORKER_SEQUENCES = _split_flat(flat, offsets)
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+        elif isinstance(sequences, PackedSequences) and sequences.store_path is not None:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_store_worker,
+                                       initargs=(sequences.store_path,))
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_restart_worker,
+                                       initargs=(flat, offsets))
+        try:
+            with pool:
+                results = list(pool.map(_restart_task, tasks))
+        finally:
+            _WORKER_SEQUENCES = None
+
+    best = min(range(n_restarts), key=lambda r: (results[r][1], r))
+    best_positions, best_score, _ = results[best]
+    best_motifs = extract_motifs(sequences, best_positions, k)
+    traces = [{'restart': r, 'spawn_key': seeds[r].spawn_key, 'score': score,
+               'positions': positions.tolist(), 'trace': trace}
+              for r, (positions, score, trace) in enumerate(results)]
+    return best_motifs, best_score, traces
+
+def gibbs_sampler_adaptive(sequences: SequenceInput, k: int, n_restarts: int, max_iterations: int = 1000,
+                           patience: float = 10, slice_iterations: int = 50, warmup: float = 25,
+                           prune_margin: Optional[int] = None, time_budget: Optional[float] = None,
+                           seed: Optional[int] = None) -> Tuple[List[str], int, List[Dict]]:
+    # Round-robin scheduler over restarts: each active chain runs `slice_iterations`
+    # steps per round, stops on a `patience`-long plateau, and after `warmup` is
+    # abandoned if its best score trails the global best by more than `prune_margin`
+    # (default: one mismatch per sequence). `time_budget` caps total wall time.
+    # `patience` and `warmup` count sweeps (len(sequences) iterations each): a step
+    # resamples one sequence, so a chain is only judged once every sequence has been
+    # resampled many times, however many sequences there are.
+    encoded = encode_all(sequences)
+    if prune_margin is None:
+        prune_margin = len(sequences)
+    patience = int(np.ceil(patience * len(encoded)))
+    warmup = int(np.ceil(warmup * len(encoded)))
+    seeds = np.random.SeedSequence(seed).spawn(n_restarts)
+    chains = [GibbsChain(encoded, k, np.random.default_rng(s)) for s in seeds]
+    status = ['running'] * n_restarts
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+    active = list(range(n_restarts))
+    while active:
+        for r in active:
+            chain = chains[r]
+            steps = min(slice_iterations, max_iterations - chain.iterations)
+            if chain.run(steps, patience):
+                status[r] = 'converged'
+            elif chain.iterations >= max_iterations:
+                status[r] = 'max_iterations'
+        global_best = min(chain.best_score for chain in chains)
+        for r in active:
+            if (status[r] == 'running' and chains[r].iterations >= warmup
+                    and chains[r].best_score > global_best + prune_margin):
+                status[r] = 'pruned'
+        active = [r for r in active if status[r] == 'running']
+        if deadline is not None and time.perf_counter() >= deadline:
+            for r in active:
+                status[r] = 'time_budget'
+            break
+
+    best = min(range(n_restarts), key=lambda r: (chains[r].best_score, r))
+    best_motifs = extract_motifs(sequences, chains[best].best_positions, k)
+    report = [{'restart': r, 'status': status[r], 'iterations': chain.iterations,
+               'best_score': chain.best_score, 'best_iteration': chain.best_iteration}
+              for r, chain in enumerate(chains)]
+    return best_motifs, chains[best].best_score, report
+
+def pad_sequences(encoded: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    # N x max_len matrix padded with the unknown code, plus the true lengths
+    lengths = np.array([len(seq) for seq in encoded], dtype=np.int64)
+    padded = np.full((len(encoded), lengths.max()), UNKNOWN_CODE, dtype=np.uint8)
+    for row, seq in zip(padded, encoded):
+        row[:len(seq)] = seq
+    return padded, lengths
+
+def run_batched_chains(padded: np.ndarray, lengths: np.ndarray, k: int, n_iterations: int, n_chains: int,
+                       rng: np.random.Generator, pseudocount: float = 1.0,
+                       window_offset: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # Advances n_chains independent chains in lockstep: an R x 5 x k count tensor and
+    # an R x N position matrix, with every step done as whole-array operations.
+    # `window_offset` (N x W) is added to every window's log-score, e.g. a background term.
+    n_sequences = len(lengths)
+    n_windows = lengths - k + 1
+    windows = sliding_window_view(padded, k, axis=1)  # N x W x k view, no copy
+    valid = np.arange(windows.shape[1]) < n_windows[:, None]
+    chains = np.arange(n_chains)
+    chain_index = chains[:, None]
+    columns = np.arange(k)
+
+    positions = (rng.random((n_chains, n_sequences)) * n_windows).astype(np.int64)
+    counts = np.zeros((n_chains, 5, k), dtype=np.int64)
+    for i in range(n_sequences):
+        counts[chain_index, windows[i, positions[:, i]], columns] += 1
+
+    unknown_row = np.full((n_chains, 1, k), -np.inf)
+    for _ in range(n_iterations):
+        chosen = rng.integers(n_sequences, size=n_chains)
+        counts[chain_index, windows[chosen, positions[chains, chosen]], columns] -= 1
+
+        profile = counts[:, :4] + pseudocount
+        log_prof = np.concatenate([np.log(profile / profile.sum(axis=1, keepdims=True)), unknown_row], axis=1)
+        scores = log_prof[chains[:, None, None], windows[chosen], columns].sum(axis=2)
+        if window_offset is not None:
+            scores += window_offset[chosen]
+        scores = np.where(valid[chosen], scores, -np.inf)
+        row_max = scores.max(axis=1, keepdims=True)
+        blocked = ~np.isfinite(row_max)
+        if blocked.any():
+            # Every window overlaps an unknown symbol: draw uniformly over real windows
+            scores = np.where(blocked & valid[chosen], 0.0, scores)
+            row_max = np.where(blocked, 0.0, row_max)
+
+        # Inverse-CDF draw per chain
+        cdf = np.cumsum(np.exp(scores - row_max), axis=1)
+        u = rng.random(n_chains) * cdf[:, -1]
+        new = np.minimum((cdf < u[:, None]).sum(axis=1), n_windows[chosen] - 1)
+
+        positions[chains, chosen] = new
+        counts[chain_index, windows[chosen, new], columns] += 1
+
+    return positions, counts
+
+def gibbs_sampler_batched(sequences: SequenceInput, k: int, n_iterations: int, n_chains: int,
+                          seed: Optional[int] = None,
+                          pseudocount: float = 1.0) -> Tuple[List[str], int, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    padded, lengths = pad_sequences(encode_all(sequences))
+    positions, counts = run_batched_chains(padded, lengths, k, n_iterations, n_chains, rng, pseudocount)
+    chain_scores = hamming_from_counts(counts)
+    best = int(np.argmin(chain_scores))
+    best_motifs = extract_motifs(sequences, positions[best], k)
+    return best_motifs, int(chain_scores[best]), chain_scores
+
+class WindowIndex:
+    # Per-position prefix sums of background log-probabilities shared by every motif
+    # length k, so any window's background log-likelihood is one subtraction. Windows
+    # containing N need no mask here: the sampler's unknown profile row already gives
+    # them -inf.
+    def __init__(self, encoded: List[np.ndarray], background: Optional[np.ndarray] = None):
+        self.padded, self.lengths = pad_sequences(encoded)
+        self.background = background_frequencies(encoded) if background is None else np.asarray(background)
+        n_sequences = len(encoded)
+        zeros = np.zeros((n_sequences, 1))
+        log_background = np.append(np.log(self.background), 0.0)  # unknown symbols: log(1)
+        self.background_cumsum = np.hstack([zeros, np.cumsum(log_background[self.padded], axis=1)])
+
+    def background_log_likelihood(self, k: int) -> np.ndarray:
+        # N x W background log-likelihood of every window of length k
+        return self.background_cumsum[:, k:] - self.background_cumsum[:, :-k]
+
+# WindowIndex visible to multi-k pool workers (inherited on fork, set by the initializer otherwise)
+_WORKER_INDEX: Optional[WindowIndex] = None
+
+def _init_multi_k_worker(index: WindowIndex):
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+def scan_single_k(index: WindowIndex, k: int, n_iterations: int, n_chains: int,
+                  seed_seq: np.random.SeedSequence, pseudocount: float = 1.0,
+                  column_cost: float = 0.5) -> Dict:
+    # Sample with profile / background likelihood ratios (background from the prefix sums)
+    rng = np.random.default_rng(seed_seq)
+    offset = -index.background_log_likelihood(k)
+    positions, counts = run_batched_chains(index.padded, index.lengths, k, n_iterations, n_chains,
+                                           rng, pseudocount, offset)
+    information = information_from_counts(counts, index.background).sum(axis=-1)
+    best = int(np.argmax(information))
+    return {
+        'k': k,
+        'positions': positions[best].tolist(),
+        'score': int(hamming_from_counts(counts[best])),
+        'consensus': consensus_from_counts(counts[best]),
+        'information_bits': float(information[best]),
+        'information_per_column': float(information[best] / k),
+        'net_information_bits': float(information[best] - column_cost * k),
+        'llr_per_column': float(llr_from_counts(counts[best], index.background, pseudocount) / k),
+    }
+
+def _multi_k_task(task: Tuple[int, int, int, np.random.SeedSequence, float, float]) -> Dict:
+    return scan_single_k(_WORKER_INDEX, *task)
+
+def multi_k_scan(sequences: SequenceInput, k_values: Sequence[int], n_iterations: int = 1000,
+                 n_chains: int = 32, seed: Optional[int] = None, workers: Optional[int] = None,
+                 pseudocount: float = 1.0, column_cost: float = 0.5) -> Tuple[int, List[Dict]]:
+    # Runs a batched sampler per motif length over one shared encoding/prefix-sum index.
+    # Returns the best k and one report per k. The best k maximizes net information:
+    # total information minus `column_cost` bits per column. Per-column information
+    # can't pick a length, since every window inside the true motif scores about the
+    # same; net information grows while added columns carry more than `column_cost`
+    # bits (up to 2 for a conserved base) and shrinks once they only add flanking
+    # background, which the sampler aligns to a few tenths of a bit at most.
+    global _WORKER_INDEX
+    index = WindowIndex(encode_all(sequences))
+    k_values = list(k_values)
+    seeds = np.random.SeedSequence(seed).spawn(len(k_values))
+    tasks = [(k, n_iterations, n_chains, seed_seq, pseudocount, column_cost)
+             for k, seed_seq in zip(k_values, seeds)]
+
+    if workers == 1 or len(tasks) <= 1:
+        results = [scan_single_k(index, *task) for task in tasks]
+    else:
+        if 'fork' in multiprocessing.get_all_start_methods():
+            _WORKER_INDEX = index
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_multi_k_worker,
+                                       initargs=(index,))
+        try:
+            with pool:
+                results = list(pool.map(_multi_k_task, tasks))
+        finally:
+            _WORKER_INDEX = None
+
+    for result in results:
+        result['motifs'] = extract_motifs(sequences, result['positions'], result['k'])
+    best = max(results, key=lambda r: (r['net_information_bits'], -r['k']))
+    return best['k'], results
+
+def mismatch_counts(encoded: np.ndarray, motif: Union[str, np.ndarray]) -> np.ndarray:
+    # Hamming distance from the motif to every window, one vectorized pass per motif
+    # column; N and other unknown symbols on either side always count as a mismatch
+    motif = motif if isinstance(motif, np.ndarray) else encode_sequence(motif)
+    k = len(motif)
+    n_windows = len(encoded) - k + 1
+    if n_windows <= 0:
+        return np.zeros(0, dtype=np.int64)
+    counts = np.zeros(n_windows, dtype=np.uint8 if k < 0xFF else np.int64)
+    for j, code in enumerate(motif):
+        if code == UNKNOWN_CODE:
+            counts += 1
+        else:
+            counts += encoded[j:j + n_windows] != code
+    return counts
+
+def scan_motif(sequence: Union[str, np.ndarray], motif: Union[str, np.ndarray],
+               max_mismatches: int = 0) -> np.ndarray:
+    # Start positions of every occurrence with at most `max_mismatches` substitutions
+    encoded = sequence if isinstance(sequence, np.ndarray) else encode_sequence(sequence)
+    return np.flatnonzero(mismatch_counts(encoded, motif) <= max_mismatches)
+
+def scan_motif_all(sequences: SequenceInput, motif: Union[str, np.ndarray],
+                   max_mismatches: int = 0) -> List[np.ndarray]:
+    motif = motif if isinstance(motif, np.ndarray) else encode_sequence(motif)
+    return [scan_motif(seq, motif, max_mismatches) for seq in encode_all(sequences)]
+
+def generate_planted_sequences(n_sequences: int, length: int, k: int, mutation_rate: float = 0.0,
+                               seed: Optional[int] = None) -> Tuple[List[str], str, np.ndarray]:
+    # Uniform random sequences, each carrying one copy of a random k-mer whose bases are
+    # independently substituted with probability `mutation_rate`
+    rng = np.random.default_rng(seed)
+    motif = rng.integers(4, size=k, dtype=np.uint8)
+    codes = rng.integers(4, size=(n_sequences, length), dtype=np.uint8)
+    positions = rng.integers(0, length - k + 1, size=n_sequences)
+    for row, start in zip(codes, positions):
+        instance = motif.copy()
+        mutated = rng.random(k) < mutation_rate
+        instance[mutated] = (instance[mutated] + rng.integers(1, 4, size=mutated.sum())) % 4
+        row[start:start + k] = instance
+    return [decode_sequence(row) for row in codes], decode_sequence(motif), positions
+
 def plot_motif_distribution(motifs: List[str], k: int):
+    # Plotting stacks are only imported when a plot is requested
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    import pandas as pd
+
     counts = defaultdict(lambda: [0]*k)
     for motif in motifs:
         for i, nucleotide in enumerate(motif):
@@ -126,8 +509,12 @@ def plot_motif_distribution(motifs: List[str], k: int):
 
 if __name__ == "__main__":
     # Example usage
-    sequences = read_fasta('sequences.fasta')
     k = 8  # Length of the motif
+    if os.path.exists('sequences.fasta'):
+        sequences = load_sequences('sequences.fasta')
+    else:
+        sequences, planted, _ = generate_planted_sequences(20, 300, k, mutation_rate=0.1, seed=0)
+        print(f"sequences.fasta not found, using synthetic data with planted motif {planted}")
     n_iterations = 1000
     n_restarts = 20
 
@@ -135,8 +522,13 @@ if __name__ == "__main__":
     best_motifs, best_score = gibbs_sampler(sequences, k, n_iterations, n_restarts)
     end_time = time.time()
 
+    summary = motif_summary(np.stack(encode_all(best_motifs)))
     print(f"Best Motifs: {best_motifs}")
     print(f"Best Score: {best_score}")
+    print(f"Consensus: {summary['consensus']}")
+    print(f"Information content: {summary['information_bits']:.2f} bits, LLR: {summary['llr_bits']:.1f} bits")
+    hits = scan_motif_all(sequences, summary['consensus'], max_mismatches=1)
+    print(f"Consensus occurrences with <= 1 mismatch: {sum(len(h) for h in hits)}")
     print(f"Time taken: {end_time - start_time:.2f} seconds")
 
     plot_motif_distribution(best_motifs, k) 
@@ -0,0 +1,146 @@
+from array import array
+from collections import deque
+from typing import Iterator, Sequence, Union
+import pickle
+
+
+Pattern = Union[str, bytes]
+
+
+class AhoCorasick:
+    # Multi-pattern matcher: the trie plus failure links is compiled once into a full
+    # DFA stored as a flat array (states x alphabet classes), so scanning a text is
+    # one table lookup per symbol with no fallback loop, like a KMP automaton for a
+    # whole pattern set. Symbols that occur in no pattern share class 0.
+
+    def __init__(self, patterns: Sequence[Pattern]):
+
+        self.patterns = list(dict.fromkeys(patterns))
+        if not self.patterns:
+            raise ValueError("at least one pattern is required")
+        if any(len(p) == 0 for p in self.patterns):
+            raise ValueError("patterns must be non-empty")
+        self.is_bytes = isinstance(self.patterns[0], (bytes, bytearray))
+        if any(isinstance(p, (bytes, bytearray)) != self.is_bytes for p in self.patterns):
+            raise TypeError("patterns must be all str or all bytes")
+
+        # Alphabet compression: symbol -> dense class id (0 = not in any pattern)
+        self.classes = {}
+        for pattern in self.patterns:
+            for symbol in pattern:
+                if symbol not in self.classes:
+                    self.classes[symbol] = len(self.classes) + 1
+        self.n_classes = len(self.classes) + 1
+        self._byte_classes = None
+        if self.is_bytes and self.n_classes <= 256:
+            table = bytearray(256)
+            for symbol, cls in self.classes.items():
+                table[symbol] = cls
+            self._byte_classes = bytes(table)
+
+        # Trie
+        children = [{}]
+        terminal = [-1]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:
+                cls = self.classes[symbol]
+                nxt = children[state].get(cls)
+                if nxt is None:
+                    nxt = len(children)
+                    children[state][cls] = nxt
+                    children.append({})
+                    terminal.append(-1)
+                state = nxt
+            terminal[state] = index
+
+        n_states = len(children)
+        typecode = 'H' if n_states <= 0xFFFF else 'l'
+        C = self.n_classes
+        delta = array(typecode, bytes(array(typecode).itemsize * n_states * C))
+        fail = [0] * n_states
+        dict_link = array(typecode, bytes(array(typecode).itemsize * n_states))
+
+        # BFS fills the remaining transitions from each state's failure state
+        queue = deque()
+        for cls, child in children[0].items():
+            delta[cls] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            f = fail[state]
+            dict_link[state] = f if terminal[f] >= 0 else dict_link[f]
+            base, fail_base = state * C, f * C
+            for cls in range(C):
+                child = children[state].get(cls)
+                if child is None:
+                    delta[base + cls] = delta[fail_base + cls]
+                else:
+                    delta[base + cls] = child
+                    fail[child] = delta[fail_base + cls]
+                    queue.append(child)
+
+        self.n_states = n_states
+        self.delta = delta
+        self.match = array('l', terminal)
+        self.dict_link = dict_link
+        self.lengths = array('l', [len(p) for p in self.patterns])
+
+    def _class_stream(self, text: Pattern):
+
+        if self.is_bytes != isinstance(text, (bytes, bytearray, memoryview)):
+            raise TypeError("text and patterns must both be str or both be bytes")
+        if self._byte_classes is not None:
+            return bytes(text).translate(self._byte_classes)
+        get = self.classes.get
+        return [get(symbol, 0) for symbol in text]
+
+    def iter_matches(self, text: Pattern) -> Iterator[tuple[int, int]]:
+        # Yields (pattern index, start offset) in order of match end position
+        delta, C = self.delta, self.n_classes
+        match, dict_link, lengths = self.match, self.dict_link, self.lengths
+        state = 0
+        for pos, cls in enumerate(self._class_stream(text)):
+            state = delta[state * C + cls]
+            s = state if match[state] >= 0 else dict_link[state]
+            while s:
+                index = match[s]
+                yield index, pos - lengths[index] + 1
+                s = dict_link[s]
+
+    def find_all(self, text: Pattern) -> list[tuple[Pattern, int]]:
+
+        patterns = self.patterns
+        return [(patterns[index], offset) for index, offset in self.iter_matches(text)]
+
+    def to_bytes(self) -> bytes:
+
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AhoCorasick":
+
+        automaton = pickle.loads(data)
+        if not isinstance(automaton, cls):
+            raise TypeError("data does not contain an AhoCorasick automaton")
+        return automaton
+
+    def save(self, path: str) -> None:
+
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "AhoCorasick":
+
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+
+if __name__ == "__main__":
+    ac = AhoCorasick(["he", "she", "his", "hers"])
+    print(ac.find_all("ushers"))  # [('she', 1), ('he', 2), ('hers', 2)]
+
+    restored = AhoCorasick.from_bytes(ac.to_bytes())
+    print(restored.find_all("ahishers"))
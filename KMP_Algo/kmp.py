@@ -1,3 +1,9 @@
+import mmap
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional, Union
+
+
 def build_lps(pattern: str) -> list[int]:
     
     lps = [0] * len(pattern)
@@ -18,12 +24,104 @@ def build_lps(pattern: str) -> list[int]:
     return lps
 
 
-def kmp_search(text: str, pattern: str) -> int:
+class CompiledPattern:
+    # A pattern with its lps table built once, for repeated searches
+
+    def __init__(self, pattern: Union[str, bytes]):
+
+        self.pattern = pattern
+        self.lps = build_lps(pattern)
+
+    def search(self, text: str) -> int:
+
+        return kmp_search(text, self.pattern, lps=self.lps)
+
+    def find_all(self, text: str, overlapping: bool = True) -> list[int]:
+
+        return kmp_find_all(text, self.pattern, overlapping, lps=self.lps)
+
+    def __repr__(self) -> str:
+
+        return f"CompiledPattern({self.pattern!r})"
+
+
+class PatternCache:
+    # Bounded LRU of CompiledPattern keyed by pattern; thread-safe so a long-running
+    # service can share one instance. Memory stays at `maxsize` compiled patterns
+    # however many distinct patterns pass through.
+
+    def __init__(self, maxsize: int = 512):
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pattern: Union[str, bytes]) -> CompiledPattern:
+
+        key = bytes(pattern) if isinstance(pattern, bytearray) else pattern
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+        compiled = CompiledPattern(key)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def info(self) -> dict:
+
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_pattern_cache = PatternCache()
+
+
+def compile_pattern(pattern: Union[str, bytes]) -> CompiledPattern:
+
+    return _pattern_cache.get(pattern)
+
+
+def pattern_cache_info() -> dict:
+
+    return _pattern_cache.info()
+
+
+def _lps_for(pattern) -> list[int]:
+    # lps from the shared cache; unhashable patterns (e.g. lists) are built directly
+    try:
+        return _pattern_cache.get(pattern).lps
+    except TypeError:
+        return build_lps(pattern)
+
+
+def kmp_search(text: str, pattern: str, lps: Optional[list[int]] = None) -> int:
     
     if not pattern:
         return 0
 
-    lps = build_lps(pattern)
+    if lps is None:
+        lps = _lps_for(pattern)
     i = j = 0  # i -> text, j -> pattern
 
     while i < len(text):
@@ -40,12 +138,14 @@ def kmp_search(text: str, pattern: str) -> int:
     return -1
 
 
-def kmp_find_all(text: str, pattern: str) -> list[int]:
+def kmp_find_all(text: str, pattern: str, overlapping: bool = True,
+                 lps: Optional[list[int]] = None) -> list[int]:
     
     if not pattern:
         return list(range(len(text) + 1))
 
-    lps = build_lps(pattern)
+    if lps is None:
+        lps = _lps_for(pattern)
     i = j = 0
     res = []
 
@@ -55,7 +155,7 @@ def kmp_find_all(text: str, pattern: str) -> list[int]:
             j += 1
             if j == len(pattern):
                 res.append(i - j)
-                j = lps[j - 1]  # look for next match
+                j = lps[j - 1] if overlapping else 0  # look for next match
         else:
             if j != 0:
                 j = lps[j - 1]
@@ -64,6 +164,240 @@ def kmp_find_all(text: str, pattern: str) -> list[int]:
     return res
 
 
+def _bmh_matches(text, pattern, overlapping: bool = True) -> Iterator[int]:
+    # Boyer-Moore-Horspool: compare right to left and shift on the text symbol under
+    # the pattern's last position. Works on any sequence of hashable symbols.
+    n, m = len(text), len(pattern)
+    shift = {}
+    for k in range(m - 1):
+        shift[pattern[k]] = m - 1 - k
+    i = 0
+    while i <= n - m:
+        last = text[i + m - 1]
+        j = m - 1
+        while j >= 0 and text[i + j] == pattern[j]:
+            j -= 1
+        if j < 0:
+            yield i
+            if not overlapping:
+                i += m
+                continue
+        i += shift.get(last, m)
+
+
+def bmh_find_all(text, pattern, overlapping: bool = True) -> list[int]:
+
+    if not pattern:
+        return list(range(len(text) + 1))
+    return list(_bmh_matches(text, pattern, overlapping))
+
+
+def _find_all_builtin(text, pattern, overlapping: bool = True) -> list[int]:
+    # Repeated built-in find. For overlapping matches, restarting at i + 1 after every
+    # hit degrades to O(n * m) on periodic text, so once a match is found we use the
+    # pattern's smallest period p: no match can start inside (i, i + p),
+    # and one at i + p only needs the p symbols past the current match checked.
+    m = len(pattern)
+    step = m
+    period = tail = None
+    res = []
+    i = text.find(pattern)
+    while i != -1:
+        res.append(i)
+        if overlapping:
+            if period is None:
+                period = m - _lps_for(pattern)[-1]
+                tail = pattern[m - period:]
+                step = period + 1
+            while text[i + m:i + m + period] == tail:
+                i += period
+                res.append(i)
+        i = text.find(pattern, i + step)
+    return res
+
+
+def _is_native(text, pattern) -> bool:
+
+    if isinstance(pattern, str):
+        return isinstance(text, str)
+    return isinstance(pattern, (bytes, bytearray)) and isinstance(text, (bytes, bytearray))
+
+
+STRATEGIES = ("find", "kmp", "bmh")
+
+# On generic sequences BMH wins once its shifts are long enough to beat KMP's
+# one-symbol-per-step loop: patterns of a few symbols over a non-tiny alphabet
+# (see benchmarks/kmp_strategies.py).
+BMH_MIN_LENGTH = 3
+BMH_MIN_ALPHABET = 4
+
+
+def choose_strategy(text, pattern, overlapping: bool = True) -> str:
+    # str/bytes go to the C-level find, whose period skip keeps overlapping scans of
+    # periodic text linear. Other sequences (token lists, tuples, ...) pick KMP or BMH
+    # from the pattern's length and alphabet, except that overlapping search for a
+    # pattern with a proper period (a non-empty border) goes to KMP: after each hit
+    # BMH only shifts by the period and re-compares the whole window, O(n * m) on
+    # periodic text, where KMP resumes from the border.
+    if _is_native(text, pattern):
+        return "find"
+    if len(pattern) < BMH_MIN_LENGTH:
+        return "kmp"
+    try:
+        alphabet = len(set(pattern))
+    except TypeError:  # unhashable symbols: BMH's shift table needs hashing
+        return "kmp"
+    if overlapping and _lps_for(pattern)[-1] > 0:
+        return "kmp"
+    # a short pattern can't show many symbols; ask it to be all-distinct instead
+    return "bmh" if alphabet >= min(len(pattern), BMH_MIN_ALPHABET) else "kmp"
+
+
+def _resolve_strategy(text, pattern, strategy, overlapping: bool) -> str:
+
+    if strategy is None:
+        return choose_strategy(text, pattern, overlapping)
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown strategy {strategy!r}; expected one of {STRATEGIES}")
+    if strategy == "find" and not _is_native(text, pattern):
+        raise TypeError("the 'find' strategy needs str or bytes text and pattern")
+    return strategy
+
+
+def find_all(text, pattern, overlapping: bool = True, strategy: str = None) -> list[int]:
+    # Same results as kmp_find_all (overlapping by default) with the fastest strategy
+    if not pattern:
+        return list(range(len(text) + 1))
+    strategy = _resolve_strategy(text, pattern, strategy, overlapping)
+    if strategy == "find":
+        return _find_all_builtin(text, pattern, overlapping)
+    if strategy == "bmh":
+        return list(_bmh_matches(text, pattern, overlapping))
+    return kmp_find_all(text, pattern, overlapping)
+
+
+def search(text, pattern, strategy: str = None) -> int:
+    # Same result as kmp_search: first match index or -1
+    if not pattern:
+        return 0
+    strategy = _resolve_strategy(text, pattern, strategy, True)
+    if strategy == "find":
+        return text.find(pattern)
+    if strategy == "bmh":
+        return next(_bmh_matches(text, pattern), -1)
+    return kmp_search(text, pattern)
+
+
+def kmismatch_find_all(text, pattern, k: int) -> list[int]:
+    # Start offsets of every window of `text` that differs from `pattern` in at most
+    # k positions (Hamming distance), in one left-to-right pass (shift-add).
+    # The state packs one mismatch counter per pattern prefix into a single int,
+    # `width` bits each (wide enough to count to m, so counters never overflow):
+    # field j holds the mismatches between pattern[:j + 1] and the text ending here.
+    # Each symbol shifts every counter up one field and adds that symbol's mismatch
+    # mask; field m - 1 then scores the window ending at the current symbol.
+    m = len(pattern)
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if m == 0:
+        return list(range(len(text) + 1))
+    if k >= m:
+        return list(range(len(text) - m + 1))
+
+    width = m.bit_length()
+    ones = 0
+    for j in range(m):
+        ones |= 1 << (j * width)
+    masks = {}
+    for j, symbol in enumerate(pattern):
+        masks.setdefault(symbol, ones)
+        masks[symbol] &= ~(1 << (j * width))
+    full = (1 << (m * width)) - 1
+    top = (m - 1) * width
+
+    state = 0
+    res = []
+    for i, symbol in enumerate(text):
+        state = ((state << width) + masks.get(symbol, ones)) & full
+        if i >= m - 1 and state >> top <= k:
+            res.append(i - m + 1)
+    return res
+
+
+class KMPStreamMatcher:
+    # Incremental KMP: feed the text in chunks (all str or all bytes, like the pattern).
+    # The partial-match length j and the number of symbols consumed carry over between
+    # chunks, so matches spanning chunk boundaries are found and offsets are absolute.
+
+    def __init__(self, pattern: Union[str, bytes]):
+
+        if not pattern:
+            raise ValueError("pattern must be non-empty")
+        self.pattern = pattern
+        self.lps = _lps_for(pattern)
+        self.first = pattern[0:1]
+        self.reset()
+
+    def reset(self) -> None:
+
+        self.j = 0          # length of the current partial match
+        self.position = 0   # symbols consumed so far
+
+    def feed(self, chunk: Union[str, bytes]) -> list[int]:
+
+        pattern, lps, first = self.pattern, self.lps, self.first
+        m, n = len(pattern), len(chunk)
+        j = self.j
+        base = self.position
+        res = []
+        i = 0
+        while i < n:
+            if j == 0:
+                # no partial match: jump straight to the next occurrence of pattern[0]
+                i = chunk.find(first, i)
+                if i == -1:
+                    break
+            if chunk[i] == pattern[j]:
+                i += 1
+                j += 1
+                if j == m:
+                    res.append(base + i - m)
+                    j = lps[j - 1]
+            elif j != 0:
+                j = lps[j - 1]
+            else:
+                i += 1
+        self.j = j
+        self.position = base + n
+        return res
+
+    def iter_matches(self, chunks: Iterable[Union[str, bytes]]) -> Iterator[int]:
+
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+
+def scan_file(path: str, pattern: Union[str, bytes], chunk_size: int = 1 << 20,
+              use_mmap: bool = False) -> Iterator[int]:
+    # Yields byte offsets of every (overlapping) match using constant memory.
+    # A str pattern is matched as its UTF-8 encoding.
+
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    matcher = KMPStreamMatcher(pattern)
+    with open(path, "rb") as f:
+        if use_mmap:
+            size = f.seek(0, 2)
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, size, chunk_size):
+                    yield from matcher.feed(mm[start:start + chunk_size])
+        else:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                yield from matcher.feed(chunk)
+
+
 
 if __name__ == "__main__":
     text = "ababcabcabababd"
@@ -75,3 +409,8 @@ if __name__ == "__main__":
     
     all_indices = kmp_find_all("aaaaa", "aa")
     print("All indices:", all_indices)  # [0, 1, 2, 3]
+
+    matcher = KMPStreamMatcher("aa")
+    print("Streamed:", list(matcher.iter_matches(["a", "aa", "aa"])))  # [0, 1, 2, 3]
+
+    print("1 mismatch:", kmismatch_find_all("ACGTTCGAACGA", "ACGA", 1))  # [0, 4, 8]
@@ -0,0 +1,137 @@
+from math import isqrt
+from typing import Sequence, Union
+
+import numpy as np
+
+from kmp import build_lps
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class KMPDFA:
+    # KMP automaton for byte patterns compiled into a full transition table
+    # ((len(pattern) + 1) x 256). Row j is the state after matching j bytes; the lps
+    # fallback chain is folded in at compile time, so matching costs exactly one
+    # table lookup per input byte and reaching state len(pattern) reports a match.
+
+    # Inputs smaller than this are scanned with a plain Python loop; larger ones go
+    # through the lockstep NumPy driver, whose per-step overhead needs volume to pay off.
+    lockstep_threshold = 1 << 15
+
+    def __init__(self, pattern: Buffer):
+
+        if isinstance(pattern, str):
+            raise TypeError("KMPDFA matches bytes; encode the pattern first")
+        self.pattern = bytes(pattern)
+        if not self.pattern:
+            raise ValueError("pattern must be non-empty")
+
+        m = len(self.pattern)
+        lps = build_lps(self.pattern)
+        dtype = np.uint8 if m < 0xFF else np.uint16 if m < 0xFFFF else np.uint32
+        table = np.zeros((m + 1, 256), dtype=dtype)
+        table[0, self.pattern[0]] = 1
+        for j in range(1, m + 1):
+            # on a mismatch in state j KMP falls back to lps[j - 1] and retries there
+            table[j] = table[lps[j - 1]]
+            if j < m:
+                table[j, self.pattern[j]] = j + 1
+
+        self.m = m
+        self.table = table
+        self._rows = [row.tolist() for row in table]
+
+    def _scan(self, data: Buffer) -> list[int]:
+
+        rows, m = self._rows, self.m
+        state = 0
+        res = []
+        for i, byte in enumerate(data):
+            state = rows[state][byte]
+            if state == m:
+                res.append(i - m + 1)
+        return res
+
+    def _lockstep(self, buffers: Sequence[Buffer], segment_length: int = None) -> list[list[int]]:
+        # Every buffer is cut into segments of `segment_length` bytes; each segment also
+        # re-reads the m - 1 bytes before it, which is enough to make the DFA state exact
+        # from the segment's first own byte onwards. All segments then advance one byte
+        # per step together: states = table[states, column].
+        m = self.m
+        overlap = m - 1
+        lengths = [len(buf) for buf in buffers]
+        total = sum(lengths)
+        if segment_length is None:
+            segment_length = max(256, m, isqrt(total))
+
+        parts, seg_buffer, seg_own, seg_start = [], [], [], []
+        pad = np.zeros(overlap, dtype=np.uint8)
+        base = 0
+        for index, buf in enumerate(buffers):
+            parts.append(pad)
+            parts.append(np.frombuffer(buf, dtype=np.uint8))
+            base += overlap
+            for own in range(0, lengths[index], segment_length):
+                seg_buffer.append(index)
+                seg_own.append(own)
+                seg_start.append(base + own - overlap)
+            base += lengths[index]
+        width = segment_length + overlap
+        parts.append(np.zeros(width, dtype=np.uint8))
+        flat = np.concatenate(parts)
+
+        res = [[] for _ in buffers]
+        if not seg_start:
+            return res
+        windows = np.lib.stride_tricks.sliding_window_view(flat, width)
+        columns = np.ascontiguousarray(windows[np.asarray(seg_start)].T)
+
+        table = self.table
+        states = np.zeros(columns.shape[1], dtype=table.dtype)
+        hits = np.empty(columns.shape, dtype=bool)
+        for t in range(width):
+            states = table[states, columns[t]]
+            np.equal(states, m, out=hits[t])
+
+        seg, t = np.nonzero(hits.T)
+        seg_buffer = np.asarray(seg_buffer)[seg]
+        end = np.asarray(seg_own)[seg] + t - overlap
+        start = end - overlap
+        valid = (t >= overlap) & (end < np.asarray(lengths)[seg_buffer]) & (start >= 0)
+        seg_buffer, start = seg_buffer[valid], start[valid]
+        # segments of a buffer are laid out in order, so starts are already sorted
+        bounds = np.searchsorted(seg_buffer, np.arange(len(buffers) + 1))
+        for index in range(len(buffers)):
+            res[index] = start[bounds[index]:bounds[index + 1]].tolist()
+        return res
+
+    def find_all(self, data: Buffer) -> list[int]:
+
+        if len(data) < self.lockstep_threshold:
+            return self._scan(data)
+        return self._lockstep([data])[0]
+
+    def find_all_many(self, buffers: Sequence[Buffer]) -> list[list[int]]:
+        # Start offsets of every (overlapping) match, one list per input buffer.
+        buffers = list(buffers)
+        if sum(len(buf) for buf in buffers) < self.lockstep_threshold:
+            return [self._scan(buf) for buf in buffers]
+        return self._lockstep(buffers)
+
+    def count(self, data: Buffer) -> int:
+
+        return len(self.find_all(data))
+
+
+def compile_dfa(pattern: Buffer) -> KMPDFA:
+
+    return KMPDFA(pattern)
+
+
+
+if __name__ == "__main__":
+    dfa = compile_dfa(b"ababd")
+    print(dfa.find_all(b"ababcabcabababd"))  # [10]
+
+    print(compile_dfa(b"aa").find_all_many([b"aaaaa", b"", b"baab"]))  # [[0, 1, 2, 3], [], [1]]
@@ -0,0 +1,130 @@
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+
+from kmp import compile_pattern, kmp_find_all
+
+
+Text = Union[str, bytes]
+
+# Inputs shorter than this are searched serially: below it, pool startup and
+# chunk pickling cost more than the search itself.
+PARALLEL_THRESHOLD = 1 << 22
+CHUNKS_PER_WORKER = 4
+
+
+# Shared with the workers: inherited copy-on-write under fork, or set once per
+# worker by an initializer under spawn.
+_WORKER_TEXT = None
+_WORKER_PATTERN = None
+_WORKER_LPS = None
+_WORKER_FILE = None
+
+def _init_text_worker(text: Text, pattern: Text, lps: list[int]):
+    global _WORKER_TEXT, _WORKER_PATTERN, _WORKER_LPS
+    _WORKER_TEXT, _WORKER_PATTERN, _WORKER_LPS = text, pattern, lps
+
+def _init_file_worker(path: str, pattern: bytes, lps: list[int]):
+    # Map the file in the worker instead of receiving a pickled copy
+    global _WORKER_TEXT, _WORKER_PATTERN, _WORKER_LPS, _WORKER_FILE
+    _WORKER_FILE = open(path, "rb")
+    _WORKER_TEXT = mmap.mmap(_WORKER_FILE.fileno(), 0, access=mmap.ACCESS_READ)
+    _WORKER_PATTERN, _WORKER_LPS = pattern, lps
+
+def _chunk_task(bounds: tuple[int, int]) -> list[int]:
+    # The chunk owns matches starting in [start, stop); reading m - 1 symbols past
+    # `stop` completes exactly those, so neighbouring chunks never report the same one.
+    start, stop = bounds
+    window = _WORKER_TEXT[start:stop + len(_WORKER_PATTERN) - 1]
+    return [start + i for i in kmp_find_all(window, _WORKER_PATTERN, lps=_WORKER_LPS)]
+
+def plan_chunks(n: int, m: int, n_chunks: int) -> list[tuple[int, int]]:
+    # Owned ranges over the n - m + 1 possible match starts
+    starts = n - m + 1
+    if starts <= 0:
+        return []
+    size = -(-starts // max(1, n_chunks))
+    return [(start, min(start + size, starts)) for start in range(0, starts, size)]
+
+
+def _collect(pool: ProcessPoolExecutor, chunks: list[tuple[int, int]]) -> list[int]:
+    # map() keeps chunk order and chunks own disjoint ranges, so concatenating
+    # their results yields sorted offsets without duplicates
+    global _WORKER_TEXT, _WORKER_PATTERN, _WORKER_LPS
+    try:
+        with pool:
+            res = []
+            for found in pool.map(_chunk_task, chunks):
+                res.extend(found)
+            return res
+    finally:
+        _WORKER_TEXT = _WORKER_PATTERN = _WORKER_LPS = None
+
+
+def _workers_and_chunks(n: int, m: int, workers: Optional[int],
+                        n_chunks: Optional[int]) -> tuple[int, list[tuple[int, int]]]:
+
+    workers = workers or os.cpu_count() or 1
+    return workers, plan_chunks(n, m, n_chunks or workers * CHUNKS_PER_WORKER)
+
+
+def parallel_find_all(text: Text, pattern: Text, workers: Optional[int] = None,
+                      n_chunks: Optional[int] = None,
+                      threshold: int = PARALLEL_THRESHOLD) -> list[int]:
+    # Same result as kmp_find_all (overlapping matches), searched chunk-wise on a
+    # process pool that shares one lps table.
+    if not pattern:
+        return kmp_find_all(text, pattern)
+    lps = compile_pattern(pattern).lps
+    if workers == 1 or len(text) < threshold:
+        return kmp_find_all(text, pattern, lps=lps)
+
+    workers, chunks = _workers_and_chunks(len(text), len(pattern), workers, n_chunks)
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _init_text_worker(text, pattern, lps)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_text_worker,
+                                   initargs=(text, pattern, lps))
+    return _collect(pool, chunks)
+
+
+def parallel_find_all_file(path: str, pattern: Text, workers: Optional[int] = None,
+                           n_chunks: Optional[int] = None,
+                           threshold: int = PARALLEL_THRESHOLD) -> list[int]:
+    # Byte offsets of every match in a file; workers read it through mmap.
+    # A str pattern is matched as its UTF-8 encoding.
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    size = os.path.getsize(path)
+    if not pattern or size < max(threshold, len(pattern)):
+        with open(path, "rb") as f:
+            return kmp_find_all(f.read(), pattern)
+
+    lps = compile_pattern(pattern).lps
+    if workers == 1:
+        # Large file, serial search: kmp_find_all only indexes the text, so it can
+        # run over the mapping without reading the file into memory
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return kmp_find_all(mapped, pattern, lps=lps)
+
+    workers, chunks = _workers_and_chunks(size, len(pattern), workers, n_chunks)
+    with open(path, "rb") as f:
+        if 'fork' in multiprocessing.get_all_start_methods():
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                _init_text_worker(mapped, pattern, lps)
+                pool = ProcessPoolExecutor(max_workers=workers,
+                                           mp_context=multiprocessing.get_context('fork'))
+                return _collect(pool, chunks)
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_file_worker,
+                                   initargs=(path, pattern, lps))
+        return _collect(pool, chunks)
+
+
+
+if __name__ == "__main__":
+    text = "abab" * 1_000_000
+    found = parallel_find_all(text, "aba", workers=4, threshold=0)
+    print(len(found), found[:3], found == kmp_find_all(text, "aba"))
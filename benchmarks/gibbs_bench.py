@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Gibbs sampler benchmark
+Times build_profile, sample_motif and gibbs_sampler on synthetic sequences with a
+planted motif, and measures how long a chain takes to recover the planted motif.
+
+    python benchmarks/gibbs_bench.py                       # default workload
+    python benchmarks/gibbs_bench.py --n 100 --length 1000 --k 12 --mutation-rate 0.1
+    python benchmarks/gibbs_bench.py --save-baseline base.json
+    python benchmarks/gibbs_bench.py --compare base.json   # exit 1 on regression
+    python benchmarks/gibbs_bench.py --profile prof/       # one .prof per stage
+    py-spy record -- python benchmarks/gibbs_bench.py --stage sample_motif --loop 30
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import Gibbs_Sampler as gibbs
+from motif_scoring import consensus_from_counts
+
+STAGES = ('build_profile', 'sample_motif', 'gibbs_sampler', 'recovery')
+
+
+def measure(fn: Callable[[], int], repeat: int, profile_path: Optional[str] = None) -> Dict:
+    """Best-of-N wall time, operations/sec and tracemalloc peak for one stage
+
+    `fn` runs the stage once and returns how many operations (steps) it did.
+    """
+    best = float('inf')
+    operations = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operations = fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if profile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.runcall(fn)
+        profiler.dump_stats(profile_path)
+
+    return {'seconds': best, 'ops_per_sec': operations / best if best > 0 else 0.0,
+            'peak_bytes': peak}
+
+
+def time_to_recover(encoded, planted: str, k: int, seed: int, max_iterations: int,
+                    max_mismatches: int, patience: int = 300, check_every: int = 10) -> Dict:
+    """Run chains until a consensus is within `max_mismatches` of the planted motif
+
+    A chain that plateaus for `patience` iterations (typically stuck on a shifted
+    copy of the motif) is replaced by a fresh restart, as in the real sampler.
+    """
+    target = np.frombuffer(planted.encode(), dtype=np.uint8)
+    seeds = np.random.SeedSequence(seed)
+    total = 0
+    restarts = 0
+    start = time.perf_counter()
+    while total < max_iterations:
+        chain = gibbs.GibbsChain(encoded, k, np.random.default_rng(seeds.spawn(1)[0]))
+        restarts += 1
+        while total < max_iterations:
+            converged = chain.run(check_every, patience)
+            total += check_every
+            found = np.frombuffer(consensus_from_counts(chain.counts).encode(), dtype=np.uint8)
+            if np.count_nonzero(found != target) <= max_mismatches:
+                return {'recovered': True, 'iterations': total, 'restarts': restarts,
+                        'seconds': time.perf_counter() - start}
+            if converged:
+                break
+    return {'recovered': False, 'iterations': total, 'restarts': restarts,
+            'seconds': time.perf_counter() - start}
+
+
+def build_stages(args, sequences, planted):
+    """Callables for each stage, all sharing one synthetic data set"""
+    rng = np.random.default_rng(args.seed)
+    k = args.k
+    encoded = gibbs.encode_all(sequences)
+    starts = rng.integers(0, args.length - k + 1, size=len(sequences))
+    motifs = [seq[s:s + k] for seq, s in zip(sequences, starts)]
+    profile = gibbs.build_profile(motifs)
+
+    def build_profile():
+        for _ in range(100):
+            gibbs.build_profile(motifs)
+        return 100
+
+    def sample_motif():
+        for _ in range(100):
+            gibbs.sample_motif(sequences[0], profile, k)
+        return 100
+
+    def gibbs_sampler():
+        gibbs.gibbs_sampler(sequences, k, args.iterations, args.restarts)
+        return args.iterations * args.restarts
+
+    def recovery():
+        result = time_to_recover(encoded, planted, k, args.seed, args.recovery_iterations,
+                                 args.max_mismatches)
+        return result['iterations']
+
+    return {'build_profile': build_profile, 'sample_motif': sample_motif,
+            'gibbs_sampler': gibbs_sampler, 'recovery': recovery}, encoded
+
+
+def compare(results: Dict, baseline_path: str, tolerance: float) -> bool:
+    """Print per-stage speed ratios against a saved baseline; False on regression"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    ok = True
+    for stage, result in results['stages'].items():
+        base = baseline['stages'].get(stage)
+        if not base or not base['ops_per_sec']:
+            continue
+        ratio = result['ops_per_sec'] / base['ops_per_sec']
+        regressed = ratio < 1 - tolerance
+        ok &= not regressed
+        print(f"  {stage:<14} {ratio:6.2f}x baseline{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Gibbs motif sampler')
+    parser.add_argument('--n', type=int, default=30, help='number of sequences')
+    parser.add_argument('--length', type=int, default=500, help='length of each sequence')
+    parser.add_argument('--k', type=int, default=10, help='planted motif length')
+    parser.add_argument('--mutation-rate', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--restarts', type=int, default=2)
+    parser.add_argument('--recovery-iterations', type=int, default=20000,
+                        help='iteration cap for the recovery stage')
+    parser.add_argument('--max-mismatches', type=int, default=1,
+                        help='consensus mismatches allowed when checking recovery')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--stage', choices=STAGES, action='append', help='only run these stages')
+    parser.add_argument('--loop', type=float, default=0,
+                        help='run the selected stage(s) repeatedly for this many seconds (for py-spy)')
+    parser.add_argument('--profile', metavar='DIR', help='write a cProfile .prof file per stage')
+    parser.add_argument('--save-baseline', metavar='JSON')
+    parser.add_argument('--compare', metavar='JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown vs baseline')
+    args = parser.parse_args()
+
+    sequences, planted, _ = gibbs.generate_planted_sequences(args.n, args.length, args.k,
+                                                             args.mutation_rate, args.seed)
+    stages, encoded = build_stages(args, sequences, planted)
+    selected = args.stage or list(STAGES)
+
+    if args.loop:
+        deadline = time.perf_counter() + args.loop
+        while time.perf_counter() < deadline:
+            for name in selected:
+                stages[name]()
+        return
+
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = {
+        'config': {key: value for key, value in vars(args).items()
+                   if key in ('n', 'length', 'k', 'mutation_rate', 'seed', 'iterations', 'restarts',
+                              'recovery_iterations', 'max_mismatches')},
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'stages': {},
+    }
+    for name in selected:
+        profile_path = os.path.join(args.profile, f'{name}.prof') if args.profile else None
+        results['stages'][name] = measure(stages[name], args.repeat, profile_path)
+    if 'recovery' in selected:
+        results['recovery'] = time_to_recover(encoded, planted, args.k, args.seed,
+                                              args.recovery_iterations, args.max_mismatches)
+
+    for name, result in results['stages'].items():
+        print(f"{name:<14} {result['ops_per_sec']:12,.0f} ops/s  {result['seconds'] * 1000:9.1f} ms"
+              f"  peak {result['peak_bytes'] / 1024:9.1f} KiB")
+    if 'recovery' in results:
+        recovery = results['recovery']
+        status = 'recovered' if recovery['recovered'] else 'NOT recovered'
+        print(f"planted motif {planted} {status} after {recovery['iterations']} iterations, "
+              f"{recovery['restarts']} restart(s) ({recovery['seconds']:.2f}s)")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
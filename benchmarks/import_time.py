@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Cold-start import benchmark
+Measures module import cost with `python -X importtime` and fails when a
+compute module exceeds its budget or pulls in a plotting stack.
+
+    python benchmarks/import_time.py            # check all budgets
+    python benchmarks/import_time.py --json     # machine-readable results
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLOTTING_MODULES = ('matplotlib', 'seaborn', 'pandas')
+
+# (directory relative to the repo root, module, budget in milliseconds)
+TARGETS = [
+    ('.', 'Gibbs_Sampler', 300),
+    ('Dictionary-attack', 'dictionary_attack', 75),
+    ('Dictionary-attack', 'attack_analyzer', 250),
+    ('Dictionary-attack', 'password_generator', 200),
+]
+
+
+def measure_import(directory: str, module: str) -> Tuple[float, Dict[str, float]]:
+    """Import a module in a fresh interpreter; return (total ms, {module: cumulative ms})"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.join(ROOT, directory), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split(':', 1)[1].split('|')
+        cumulative[name.strip()] = float(cumulative_us) / 1000
+    return cumulative[module], cumulative
+
+
+def run(repeat: int) -> List[Dict]:
+    results = []
+    for directory, module, budget in TARGETS:
+        samples = []
+        imported = {}
+        for _ in range(repeat):
+            total, imported = measure_import(directory, module)
+            samples.append(total)
+        plotting = sorted({name.split('.')[0] for name in imported} & set(PLOTTING_MODULES))
+        results.append({
+            'module': module,
+            'median_ms': statistics.median(samples),
+            'min_ms': min(samples),
+            'budget_ms': budget,
+            'plotting_modules': plotting,
+            'ok': statistics.median(samples) <= budget and not plotting,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check cold-start import budgets')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per module')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+    
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            status = 'ok' if r['ok'] else 'FAIL'
+            extra = f"  imports {', '.join(r['plotting_modules'])}" if r['plotting_modules'] else ''
+            print(f"{status:>4}  {r['module']:<20} {r['median_ms']:7.1f} ms "
+                  f"(min {r['min_ms']:.1f}, budget {r['budget_ms']}){extra}")
+    sys.exit(0 if all(r['ok'] for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Search strategy matrix for KMP_Algo/kmp.py
+Times every applicable strategy (built-in find loop, KMP, Boyer-Moore-Horspool) on
+workloads chosen so that each one wins somewhere, checks that all of them return
+exactly what kmp_find_all returns, and shows what choose_strategy picks.
+
+    python benchmarks/kmp_strategies.py
+    python benchmarks/kmp_strategies.py --size 200000 --repeat 5 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'KMP_Algo'))
+
+from kmp import STRATEGIES, _is_native, choose_strategy, find_all, kmp_find_all
+
+
+def build_cases(size: int, seed: int) -> List[Dict]:
+    """Named (text, pattern) workloads"""
+    rng = random.Random(seed)
+    dna = ''.join(rng.choice('ACGT') for _ in range(size))
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(2, 9)))
+             for _ in range(500)]
+    prose = ' '.join(rng.choice(words) for _ in range(size // 6))[:size]
+    tokens = [rng.randrange(1000) for _ in range(size)]
+    bits = [rng.randrange(2) for _ in range(size)]
+
+    def sample(seq, length):
+        start = rng.randrange(len(seq) - length)
+        return seq[start:start + length]
+
+    return [
+        dict(name='dna str, k=8', text=dna, pattern=sample(dna, 8)),
+        dict(name='dna bytes, k=64', text=dna.encode(), pattern=sample(dna, 64).encode()),
+        dict(name='prose str, 24 chars', text=prose, pattern=sample(prose, 24)),
+        dict(name='periodic run, k=256', text='a' * size, pattern='a' * 256),
+        dict(name='periodic run, k=2', text='a' * size, pattern='aa'),
+        dict(name='int tokens, k=16', text=tokens, pattern=sample(tokens, 16)),
+        dict(name='int tokens, k=3', text=tokens, pattern=sample(tokens, 3)),
+        dict(name='int tokens, k=2', text=tokens, pattern=sample(tokens, 2)),
+        dict(name='binary tokens, k=2', text=bits, pattern=[1, 0]),
+        dict(name='binary tokens, k=12', text=bits, pattern=sample(bits, 12)),
+        dict(name='periodic tokens, k=256', text=[0, 1, 2, 3] * (size // 4), pattern=[0, 1, 2, 3] * 64),
+    ]
+
+
+def best_time(fn: Callable[[], list], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(size: int, seed: int, repeat: int, overlapping: bool) -> List[Dict]:
+    results = []
+    for case in build_cases(size, seed):
+        text, pattern = case['text'], case['pattern']
+        expected = kmp_find_all(text, pattern, overlapping)
+        timings = {}
+        for strategy in STRATEGIES:
+            if strategy == 'find' and not _is_native(text, pattern):
+                continue
+            got = find_all(text, pattern, overlapping, strategy)
+            if got != expected:
+                raise AssertionError(f"{strategy} disagrees with kmp_find_all on {case['name']!r}")
+            timings[strategy] = best_time(lambda: find_all(text, pattern, overlapping, strategy), repeat)
+        results.append({
+            'case': case['name'],
+            'matches': len(expected),
+            'ms': {name: seconds * 1000 for name, seconds in timings.items()},
+            'fastest': min(timings, key=timings.get),
+            'chosen': choose_strategy(text, pattern, overlapping),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare kmp.py search strategies')
+    parser.add_argument('--size', type=int, default=100_000, help='text length per case')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--non-overlapping', action='store_true')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.size, args.seed, args.repeat, not args.non_overlapping)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'case':<24} {'matches':>8} " + ''.join(f"{name:>10}" for name in STRATEGIES)
+          + f"  {'fastest':<8} chosen")
+    for row in results:
+        cells = ''.join(f"{row['ms'][name]:>8.2f}ms" if name in row['ms'] else f"{'-':>10}"
+                        for name in STRATEGIES)
+        flag = '' if row['chosen'] == row['fastest'] else '  (!)'
+        print(f"{row['case']:<24} {row['matches']:>8} {cells}  {row['fastest']:<8} {row['chosen']}{flag}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,42 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Recursive function to generate Koch curve points
-def koch_curve(p1, p2, level):
-    if level == 0:
-        return [p1, p2]
+# Rotation by 60° for the equilateral triangle peak
+angle = np.pi / 3
+ROTATION = np.array([
+    [np.cos(angle), -np.sin(angle)],
+    [np.sin(angle), np.cos(angle)]
+])
 
-    p1 = np.array(p1)
-    p2 = np.array(p2)
-    diff = p2 - p1
-    one_third = p1 + diff / 3
-    two_third = p1 + 2 * diff / 3
+# One refinement step for all segments at once: (M x 2) vertices -> (4M - 3) x 2
+def koch_refine(points):
+    start, diff = points[:-1], np.diff(points, axis=0) / 3
+    refined = np.empty((4 * len(diff) + 1, 2))
+    refined[0:-1:4] = start
+    refined[1::4] = start + diff
+    refined[2::4] = start + diff + diff @ ROTATION.T
+    refined[3::4] = start + 2 * diff
+    refined[-1] = points[-1]
+    return refined
 
-    # Create the equilateral triangle peak
-    angle = np.pi / 3
-    rotation = np.array([
-        [np.cos(angle), -np.sin(angle)],
-        [np.sin(angle), np.cos(angle)]
-    ])
-    peak = one_third + rotation @ (diff / 3)
+# Levels already computed per (p1, p2); level n is built from level n - 1
+_levels = {}
 
-    # Build recursively
-    result = []
-    result += koch_curve(p1, one_third, level - 1)[:-1]
-    result += koch_curve(one_third, peak, level - 1)[:-1]
-    result += koch_curve(peak, two_third, level - 1)[:-1]
-    result += koch_curve(two_third, p2, level - 1)
-    return result
+def koch_curve(p1, p2, level):
+    key = (tuple(p1), tuple(p2))
+    if key not in _levels:
+        _levels[key] = [np.array([p1, p2], dtype=float)]
+        _levels[key][0].flags.writeable = False
+    levels = _levels[key]
+    while len(levels) <= level:
+        refined = koch_refine(levels[-1])
+        refined.flags.writeable = False  # shared by every later caller
+        levels.append(refined)
+    return levels[level]
 
 # --- Setup ---
 level = 0
-max_level = 7
+max_level = 10
 p1, p2 = [0, 0], [1, 0]
 
 fig, ax = plt.subplots()
@@ -41,7 +47,7 @@ def draw_curve():
     ax.clear()
     ax.set_aspect('equal')
     ax.axis('off')
-    points = np.array(koch_curve(p1, p2, level))
+    points = koch_curve(p1, p2, level)
     ax.plot(points[:, 0], points[:, 1], 'b-')
     ax.set_title(f'Koch Curve (Iteration {level})')
     plt.draw()
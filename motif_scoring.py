@@ -0,0 +1,112 @@
+# Vectorized quality metrics for motif sets
+#
+# A motif set is an (N x k) uint8 matrix of nucleotide codes (0..3 = A, C, G, T,
+# 4 = unknown), as produced by sequence_io.encode_sequence. Every metric also
+# accepts a batch of S sets as an (S x N x k) array and then returns one value per
+# set, so thousands of candidate sets can be ranked in a single call. The
+# *_from_counts variants take (..., 5, k) count matrices directly, which is what
+# the sampler maintains incrementally.
+
+from typing import List, Optional, Sequence, Union
+import numpy as np
+from sequence_io import NUCLEOTIDES, UNKNOWN_CODE
+
+N_CODES = UNKNOWN_CODE + 1
+UNIFORM_BACKGROUND = np.full(4, 0.25)
+
+def motif_matrix(encoded: Sequence[np.ndarray], positions: Sequence[int], k: int) -> np.ndarray:
+    return np.stack([seq[start:start + k] for seq, start in zip(encoded, positions)])
+
+def column_counts(motifs: np.ndarray) -> np.ndarray:
+    # (..., N, k) codes -> (..., 5, k) counts with one bincount over the whole batch
+    motifs = np.asarray(motifs)
+    *batch, n_motifs, k = motifs.shape
+    n_sets = int(np.prod(batch, dtype=np.int64))
+    flat = motifs.reshape(n_sets, n_motifs, k).astype(np.int64)
+    index = (np.arange(n_sets)[:, None, None] * N_CODES + flat) * k + np.arange(k)
+    counts = np.bincount(index.ravel(), minlength=n_sets * N_CODES * k)
+    return counts.reshape(*batch, N_CODES, k)
+
+def hamming_from_counts(counts: np.ndarray) -> np.ndarray:
+    # Mismatches against the per-column majority symbol (the classic Gibbs score)
+    n_motifs = counts[..., :, 0].sum(axis=-1)
+    return n_motifs * counts.shape[-1] - counts.max(axis=-2).sum(axis=-1)
+
+def base_frequencies(counts: np.ndarray, pseudocount: float = 0.0) -> np.ndarray:
+    # A/C/G/T frequencies per column; unknown symbols are left out
+    bases = counts[..., :4, :] + pseudocount
+    totals = bases.sum(axis=-2, keepdims=True)
+    return np.divide(bases, totals, out=np.full(bases.shape, 0.25), where=totals > 0)
+
+def entropy_from_counts(counts: np.ndarray, pseudocount: float = 0.0) -> np.ndarray:
+    freqs = base_frequencies(counts, pseudocount)
+    logs = np.log2(freqs, out=np.zeros_like(freqs), where=freqs > 0)
+    return 0.0 - (freqs * logs).sum(axis=-2)
+
+def information_from_counts(counts: np.ndarray, background: Optional[np.ndarray] = None,
+                            pseudocount: float = 0.0) -> np.ndarray:
+    # Per-column relative entropy (bits) against the background distribution
+    background = UNIFORM_BACKGROUND if background is None else np.asarray(background, dtype=float)
+    freqs = base_frequencies(counts, pseudocount)
+    ratio = np.log2(np.divide(freqs, background[:, None], out=np.ones_like(freqs), where=freqs > 0))
+    return (freqs * ratio).sum(axis=-2)
+
+def llr_from_counts(counts: np.ndarray, background: Optional[np.ndarray] = None,
+                    pseudocount: float = 1.0) -> np.ndarray:
+    # Log2-likelihood ratio of the motif instances under their own profile vs background
+    background = UNIFORM_BACKGROUND if background is None else np.asarray(background, dtype=float)
+    profile = base_frequencies(counts, pseudocount)
+    return (counts[..., :4, :] * np.log2(profile / background[:, None])).sum(axis=(-2, -1))
+
+def consensus_from_counts(counts: np.ndarray) -> Union[str, List[str]]:
+    best = counts[..., :4, :].argmax(axis=-2)
+    letters = np.frombuffer(NUCLEOTIDES.encode(), dtype=np.uint8)[best]
+    if letters.ndim == 1:
+        return letters.tobytes().decode('ascii')
+    return [row.tobytes().decode('ascii') for row in letters.reshape(-1, letters.shape[-1])]
+
+def hamming_score(motifs: np.ndarray) -> np.ndarray:
+    return hamming_from_counts(column_counts(motifs))
+
+def consensus(motifs: np.ndarray) -> Union[str, List[str]]:
+    return consensus_from_counts(column_counts(motifs))
+
+def column_entropy(motifs: np.ndarray, pseudocount: float = 0.0) -> np.ndarray:
+    return entropy_from_counts(column_counts(motifs), pseudocount)
+
+def information_content(motifs: np.ndarray, background: Optional[np.ndarray] = None,
+                        pseudocount: float = 0.0) -> np.ndarray:
+    return information_from_counts(column_counts(motifs), background, pseudocount)
+
+def log_likelihood_ratio(motifs: np.ndarray, background: Optional[np.ndarray] = None,
+                         pseudocount: float = 1.0) -> np.ndarray:
+    return llr_from_counts(column_counts(motifs), background, pseudocount)
+
+def background_frequencies(encoded: Sequence[np.ndarray], pseudocount: float = 1.0) -> np.ndarray:
+    # A/C/G/T frequencies over whole sequences; the pseudocount keeps every base non-zero
+    counts = np.bincount(np.concatenate(list(encoded)), minlength=N_CODES)[:4] + pseudocount
+    return counts / counts.sum()
+
+def rank_motif_sets(motif_sets: np.ndarray, metric: str = 'hamming',
+                    background: Optional[np.ndarray] = None) -> np.ndarray:
+    # Indices of the (S x N x k) candidate sets from best to worst
+    counts = column_counts(motif_sets)
+    if metric == 'hamming':
+        return np.argsort(hamming_from_counts(counts), kind='stable')
+    if metric == 'information':
+        return np.argsort(-information_from_counts(counts, background).sum(axis=-1), kind='stable')
+    if metric == 'llr':
+        return np.argsort(-llr_from_counts(counts, background), kind='stable')
+    raise ValueError(f"Unknown metric: {metric}")
+
+def motif_summary(motifs: np.ndarray, background: Optional[np.ndarray] = None) -> dict:
+    counts = column_counts(motifs)
+    information = information_from_counts(counts, background)
+    return {
+        'hamming': int(hamming_from_counts(counts)),
+        'consensus': consensus_from_counts(counts),
+        'information_bits': float(information.sum()),
+        'information_per_column': information.tolist(),
+        'entropy_per_column': entropy_from_counts(counts).tolist(),
+        'llr_bits': float(llr_from_counts(counts, background)),
+    }
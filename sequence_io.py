@@ -0,0 +1,315 @@
+# Streaming FASTA reader and compact encoded sequence storage for the Gibbs sampler
+#
+# Sequences are stored as one uint8 array of nucleotide codes plus an offsets index,
+# so sequence i is the zero-copy view codes[offsets[i]:offsets[i + 1]].
+#
+# Codes: A, C, G, T -> 0..3, anything else (N, IUPAC ambiguity codes, ...) -> 4.
+# Lowercase (soft-masked) bases keep their base code by default; pass
+# lowercase='mask' to turn them into the unknown code instead.
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from typing import BinaryIO, Iterator, List, Optional
+import numpy as np
+
+NUCLEOTIDES = 'ACGT'
+UNKNOWN_CODE = 4
+_DECODE_TABLE = np.frombuffer(b'ACGTN', dtype=np.uint8)
+_WHITESPACE = b' \t\r\n'
+
+def _make_table(lowercase: str) -> bytes:
+    if lowercase not in ('base', 'mask'):
+        raise ValueError(f"lowercase must be 'base' or 'mask', not {lowercase!r}")
+    table = bytearray([UNKNOWN_CODE]) * 256
+    for code, base in enumerate(NUCLEOTIDES):
+        table[ord(base)] = code
+        if lowercase == 'base':
+            table[ord(base.lower())] = code
+    return bytes(table)
+
+ENCODE_TABLE = _make_table('base')
+MASK_TABLE = _make_table('mask')
+
+def encode_sequence(sequence: str, lowercase: str = 'base') -> np.ndarray:
+    table = ENCODE_TABLE if lowercase == 'base' else _make_table(lowercase)
+    return np.frombuffer(sequence.encode('ascii', 'replace').translate(table), dtype=np.uint8)
+
+def decode_sequence(codes: np.ndarray) -> str:
+    return _DECODE_TABLE[codes].tobytes().decode('ascii')
+
+class PackedSequences:
+    def __init__(self, codes: np.ndarray, offsets: np.ndarray, names: List[str],
+                 store_path: Optional[str] = None):
+        self.codes = codes
+        self.offsets = offsets
+        self.names = names
+        # Set when the arrays are memory-mapped from a sequence store on disk
+        self.store_path = store_path
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.codes[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def unknown_counts(self) -> np.ndarray:
+        # Number of non-ACGT (or masked) symbols per sequence
+        unknown = np.concatenate([[0], np.cumsum(self.codes == UNKNOWN_CODE)])
+        return unknown[self.offsets[1:]] - unknown[self.offsets[:-1]]
+
+    def sequence(self, i: int) -> str:
+        return decode_sequence(self[i])
+
+def open_fasta(file_path: str) -> BinaryIO:
+    # Transparently handles gzip-compressed input (detected by magic bytes)
+    with open(file_path, 'rb') as f:
+        magic = f.read(2)
+    if magic == b'\x1f\x8b':
+        return gzip.open(file_path, 'rb')
+    return open(file_path, 'rb')
+
+def read_fasta_packed(file_path: str, block_size: int = 1 << 22, lowercase: str = 'base') -> PackedSequences:
+    table = _make_table(lowercase)
+    codes = bytearray()
+    offsets: List[int] = []
+    names: List[str] = []
+    carry = b''
+    line_start = True
+
+    with open_fasta(file_path) as f:
+        while True:
+            block = f.read(block_size)
+            if not block and not carry:
+                break
+            data = carry + block
+            carry = b''
+            pos = 0
+            comment = data.find(b'\n;')  # comment lines are rare; track the next one lazily
+            while pos < len(data):
+                if line_start and data[pos] in b'>;':
+                    end = data.find(b'\n', pos)
+                    if end == -1:
+                        if block:
+                            carry = data[pos:]  # header continues in the next block
+                            break
+                        end = len(data)
+                    if data[pos] == ord('>'):
+                        names.append(data[pos + 1:end].decode('utf-8', 'replace').strip())
+                        offsets.append(len(codes))
+                    pos = end + 1
+                    continue
+                # Sequence lines up to the next header: one translate call maps
+                # symbols to codes and drops line breaks
+                if comment != -1 and comment < pos:
+                    comment = data.find(b'\n;', pos)
+                ends = [e for e in (data.find(b'\n>', pos), comment) if e != -1]
+                end = min(ends) if ends else -1
+                segment = data[pos:] if end == -1 else data[pos:end + 1]
+                pos += len(segment)
+                line_start = segment.endswith(b'\n')
+                if not offsets and segment.strip():
+                    names.append('')
+                    offsets.append(0)
+                codes += segment.translate(table, _WHITESPACE)
+            if not block:
+                break
+
+    offsets.append(len(codes))
+    # Records with a header but no sequence are dropped, as read_fasta does
+    offsets = np.array(offsets, dtype=np.int64)
+    keep = np.diff(offsets) > 0
+    if not keep.all():
+        names = [name for name, kept in zip(names, keep) if kept]
+        offsets = np.append(offsets[:-1][keep], offsets[-1])
+    return PackedSequences(np.frombuffer(codes, dtype=np.uint8), offsets, names)
+
+
+# Memory-mapped sequence store
+#
+# A store is a directory of immutable snapshots plus a CURRENT file naming the live
+# one. A snapshot (v-*) holds codes.npy and offsets.npy (opened with mmap, so every
+# process shares the same page cache instead of copying) and meta.json with the
+# sequence names, per-sequence CRC32 checksums and the identity of the source FASTA.
+# A rebuild writes a new snapshot and then replaces CURRENT with os.replace, so
+# readers always find a complete store; the previous snapshot is kept for readers
+# that resolved CURRENT just before the switch. load_sequences() rebuilds the store
+# whenever the source file changes.
+
+STORE_VERSION = 3  # 2: records without sequence are dropped, 3: snapshot layout
+STORE_SUFFIX = '.seqstore'
+_CURRENT = 'CURRENT'
+_SNAPSHOT_PREFIX = 'v-'
+_OPEN_ATTEMPTS = 5
+
+def default_store_path(fasta_path: str, cache_dir: Optional[str] = None) -> str:
+    fasta_path = os.path.abspath(fasta_path)
+    if cache_dir is None:
+        return fasta_path + STORE_SUFFIX
+    tag = hashlib.sha1(fasta_path.encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, os.path.basename(fasta_path) + '.' + tag + STORE_SUFFIX)
+
+def _source_identity(fasta_path: str) -> dict:
+    stat = os.stat(fasta_path)
+    return {'path': os.path.abspath(fasta_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 22), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _sequence_checksums(packed: PackedSequences) -> List[int]:
+    return [zlib.crc32(packed[i]) for i in range(len(packed))]
+
+def _write_atomic(path: str, text: str):
+    # Write next to the target and rename over it: readers see the old or the new file
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def snapshot_path(store_path: str) -> str:
+    # Resolve a store to its live snapshot; a snapshot directory resolves to itself
+    try:
+        with open(os.path.join(store_path, _CURRENT)) as f:
+            return os.path.join(store_path, f.read().strip())
+    except FileNotFoundError:
+        if os.path.exists(os.path.join(store_path, 'meta.json')):
+            return store_path
+        raise FileNotFoundError(f"No sequence store at {store_path}") from None
+
+def _from_snapshot(store_path: str, load):
+    # Resolve CURRENT and load from that snapshot; if a rebuild published twice in
+    # between and pruned it, resolve again
+    for attempt in range(_OPEN_ATTEMPTS):
+        snapshot = snapshot_path(store_path)
+        try:
+            return snapshot, load(snapshot)
+        except FileNotFoundError:
+            if snapshot == store_path or attempt == _OPEN_ATTEMPTS - 1:
+                raise
+
+def _prune_snapshots(store_path: str, keep: List[str]):
+    # Drop old snapshots and files left by the pre-snapshot layout. Whatever CURRENT
+    # names now is kept too, in case a concurrent build published after ours, and
+    # in-progress builds (.tmp-*) belong to other writers and are left alone.
+    keep = keep + [os.path.basename(snapshot_path(store_path))]
+    for entry in os.listdir(store_path):
+        if entry in keep or entry == _CURRENT or entry.startswith('.tmp-'):
+            continue
+        path = os.path.join(store_path, entry)
+        if os.path.isdir(path):
+            if entry.startswith(_SNAPSHOT_PREFIX):
+                shutil.rmtree(path, ignore_errors=True)
+        elif entry in ('codes.npy', 'offsets.npy', 'meta.json'):
+            os.unlink(path)
+
+def build_sequence_store(fasta_path: str, store_path: Optional[str] = None,
+                         lowercase: str = 'base') -> str:
+    store_path = store_path or default_store_path(fasta_path)
+    source = _source_identity(fasta_path)
+    source['sha256'] = _file_sha256(fasta_path)
+    packed = read_fasta_packed(fasta_path, lowercase=lowercase)
+    meta = {
+        'version': STORE_VERSION,
+        'source': source,
+        'lowercase': lowercase,
+        'names': packed.names,
+        'checksums': _sequence_checksums(packed),
+    }
+
+    # Build the snapshot under a temporary name, then publish it by replacing CURRENT
+    os.makedirs(store_path, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=store_path)
+    try:
+        np.save(os.path.join(tmp_path, 'codes.npy'), packed.codes)
+        np.save(os.path.join(tmp_path, 'offsets.npy'), packed.offsets)
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        snapshot = _SNAPSHOT_PREFIX + os.path.basename(tmp_path)[len('.tmp-'):]
+        os.replace(tmp_path, os.path.join(store_path, snapshot))
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    try:
+        previous = os.path.basename(snapshot_path(store_path))
+    except FileNotFoundError:
+        previous = None
+    _write_atomic(os.path.join(store_path, _CURRENT), snapshot)
+    _prune_snapshots(store_path, [snapshot, previous])
+    return store_path
+
+def _load_meta(snapshot: str) -> dict:
+    with open(os.path.join(snapshot, 'meta.json')) as f:
+        return json.load(f)
+
+def _load_snapshot(snapshot: str) -> PackedSequences:
+    meta = _load_meta(snapshot)
+    if meta.get('version') != STORE_VERSION:
+        raise ValueError(f"Unsupported sequence store version: {meta.get('version')}")
+    codes = np.load(os.path.join(snapshot, 'codes.npy'), mmap_mode='r')
+    offsets = np.load(os.path.join(snapshot, 'offsets.npy'), mmap_mode='r')
+    return PackedSequences(codes, offsets, meta['names'], store_path=snapshot)
+
+def read_store_meta(store_path: str) -> dict:
+    return _from_snapshot(store_path, _load_meta)[1]
+
+def open_sequence_store(store_path: str) -> PackedSequences:
+    # The returned store_path is the snapshot itself, so worker processes that reopen
+    # it map exactly the same data even if the store is rebuilt meanwhile
+    return _from_snapshot(store_path, _load_snapshot)[1]
+
+def verify_sequence_store(store_path: str) -> List[int]:
+    # Indices of sequences whose stored codes no longer match their checksum
+    packed = open_sequence_store(store_path)
+    expected = read_store_meta(packed.store_path)['checksums']
+    return [i for i, crc in enumerate(_sequence_checksums(packed)) if crc != expected[i]]
+
+def store_is_current(store_path: str, fasta_path: str, lowercase: str = 'base',
+                     check_content: bool = False) -> bool:
+    try:
+        snapshot, meta = _from_snapshot(store_path, _load_meta)
+    except (OSError, ValueError):
+        return False
+    source = meta.get('source', {})
+    current = _source_identity(fasta_path)
+    if meta.get('version') != STORE_VERSION or meta.get('lowercase') != lowercase:
+        return False
+    if (source.get('size'), source.get('mtime_ns')) != (current['size'], current['mtime_ns']):
+        # Touched or rewritten: only a content hash can tell whether it really changed
+        if source.get('size') != current['size'] or source.get('sha256') != _file_sha256(fasta_path):
+            return False
+        # Same content; record the new mtime so the next check is cheap again
+        meta['source'].update(current)
+        try:
+            _write_atomic(os.path.join(snapshot, 'meta.json'), json.dumps(meta))
+        except OSError:
+            pass  # snapshot pruned by a concurrent rebuild; the refresh is only a shortcut
+        return True
+    return not check_content or source.get('sha256') == _file_sha256(fasta_path)
+
+def load_sequences(fasta_path: str, cache_dir: Optional[str] = None, lowercase: str = 'base',
+                   check_content: bool = False) -> PackedSequences:
+    # Open the memory-mapped store for a FASTA file, (re)building it if it is missing or stale
+    store_path = default_store_path(fasta_path, cache_dir)
+    if not store_is_current(store_path, fasta_path, lowercase, check_content):
+        build_sequence_store(fasta_path, store_path, lowercase)
+    return open_sequence_store(store_path)